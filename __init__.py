@@ -13,9 +13,11 @@ Basic usage:
     plotter.show()
 """
 
+# Defined before the submodule imports: the load cache keys on it
+__version__ = '0.1.0'
+
 from .loader import DataLoader
 from .plotter import Plotter
 from .parsers import get_parser, list_parsers
 
 __all__ = ['DataLoader', 'Plotter', 'get_parser', 'list_parsers']
-__version__ = '0.1.0'
@@ -2,11 +2,108 @@
 DataLoader - Flexible data loader for multiple file formats.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import re
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from .parsers import get_parser, PARSERS
-from .parsers.base import BaseParser, DataInfo
+from . import __version__
+from .parsers import get_parser_instance, PARSERS
+from .parsers.base import (
+    _HAS_PYARROW,
+    BaseParser,
+    DataInfo,
+    FileProbe,
+    _downcast_numeric,
+    _file_key,
+    _is_detect_cached,
+)
+
+
+# Cache entry layout; bump it when parser output or the cache format changes
+# without a release, so stale entries are never served
+_CACHE_SCHEMA = 2
+
+
+def _json_default(value):
+    """Converts numpy scalars in parser metadata to plain Python values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile(pattern: str) -> re.Pattern:
+    """Compiles a channel search pattern (cached across calls)."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+class _TimeAxis:
+    """
+    Evenly spaced time axis computed on demand (sample index * step).
+
+    Behaves like a read-only array: slicing only computes the requested
+    samples, so a generated axis costs no memory until it is materialized.
+    """
+
+    def __init__(self, n_points: int, step: float, name: str):
+        self.n_points = n_points
+        self.step = step
+        self.name = name
+
+    def __len__(self) -> int:
+        return self.n_points
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, stride = key.indices(self.n_points)
+            return np.arange(start, stop, stride, dtype=np.float64) * self.step
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self.n_points
+            if not 0 <= key < self.n_points:
+                raise IndexError(f"time index {key} out of range")
+            return float(key * self.step)
+        return np.asarray(key, dtype=np.float64) * self.step
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.to_numpy()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return f"_TimeAxis(name='{self.name}', n_points={self.n_points}, step={self.step})"
+
+    @property
+    def values(self) -> np.ndarray:
+        """Materialized time values."""
+        return self.to_numpy()
+
+    def to_numpy(self) -> np.ndarray:
+        """Computes the full time axis as a float64 array."""
+        values = np.arange(self.n_points, dtype=np.float64)
+        np.multiply(values, self.step, out=values)
+        return values
+
+    def to_series(self) -> pd.Series:
+        """Returns the time axis as a named pandas Series."""
+        return pd.Series(self.to_numpy(), name=self.name)
+
+    def min(self) -> float:
+        """Smallest time value (no materialization)."""
+        if not self.n_points:
+            return float('nan')
+        return 0.0 if self.step >= 0 else self[-1]
+
+    def max(self) -> float:
+        """Largest time value (no materialization)."""
+        if not self.n_points:
+            return float('nan')
+        return self[-1] if self.step >= 0 else 0.0
 
 
 class DataLoader:
@@ -41,13 +138,20 @@ class DataLoader:
         'h': 3600.0,
     }
 
+    # Where parsed files are cached as Parquet (see `cache` argument)
+    CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'labdataplot'
+    # Size limit of CACHE_DIR; least recently used entries are evicted beyond it
+    CACHE_MAX_BYTES = 1 << 30
+
     def __init__(
         self,
         filepath: str,
         format: str | None = None,
         time_step: float | None = None,
         time_unit: str = 's',
-        display_unit: str | None = None
+        display_unit: str | None = None,
+        cache: bool = True,
+        downcast: bool = False
     ):
         """
         Initializes the loader.
@@ -62,8 +166,20 @@ class DataLoader:
             display_unit: Unit to display on the time axis ('ms', 's', 'min', 'h').
                           If not provided, uses time_unit.
                           Useful when measuring in seconds but want to display in minutes/hours.
+            cache: Reuse a Parquet copy of the parsed file on later loads (requires pyarrow).
+                   The cache entry is keyed by path, modification time, size and library
+                   version, so it is ignored as soon as the file changes or after an
+                   upgrade. The cache is bounded by CACHE_MAX_BYTES; see clear_cache().
+                   Default: True
+            downcast: Store float64 channels as float32 and int64 as int32 where the
+                      values fit, halving memory. float32 keeps about 7 significant
+                      digits; the time column is never downcast. Default: False
         """
         self.filepath = Path(filepath)
+        self._time_axis = None
+        self._replaced_time_column = None
+        self._columns_index = None
+        self._columns_tuple = ()
         self._time_step = time_step
         self._time_unit = time_unit
         self._display_unit = display_unit or time_unit
@@ -71,25 +187,173 @@ class DataLoader:
         if not self.filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        # Select parser
-        if format:
-            parser_class = get_parser(format)
-            self._parser = parser_class()
-        else:
-            self._parser = self._auto_detect()
+        use_cache = cache and _HAS_PYARROW
+
+        if not (use_cache and self._load_cache(format)):
+            # Select parser
+            if format:
+                self._parser = get_parser_instance(format)
+            else:
+                self._parser = self._auto_detect()
+
+            # Load data
+            self._data, self._info = self._parser.parse(str(self.filepath))
+
+            if use_cache:
+                self._store_cache(format)
 
-        # Load data
-        self._data, self._info = self._parser.parse(str(self.filepath))
+        if downcast:
+            _downcast_numeric(self._data, exclude=[self._info.time_column])
 
         # Generate time axis if time_step is provided
         if time_step is not None:
             self._generate_time_axis(time_step, time_unit, self._display_unit)
 
+    @classmethod
+    def load_many(
+        cls, filepaths: list, max_workers: int | None = None, **kwargs
+    ) -> list['DataLoader']:
+        """
+        Loads several files concurrently.
+
+        Header reads, detection and parsing of each file run in a thread
+        pool; file I/O releases the GIL, so a directory of files loads
+        faster than one after the other.
+
+        Args:
+            filepaths: Paths of the files to load
+            max_workers: Number of threads (default: one per CPU)
+            **kwargs: Passed to DataLoader for every file (format, time_step, ...)
+
+        Returns:
+            list: DataLoader objects, in the order of filepaths
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(lambda path: cls(path, **kwargs), filepaths))
+
+    def _cache_paths(self, format: str | None) -> tuple[Path, Path]:
+        """Returns the (Parquet data, JSON info) cache paths for the current file state."""
+        stat = self.filepath.stat()
+        fmt = (format or '').lower()
+        key = (
+            f'{self.filepath.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{fmt}'
+            f'|{__version__}|{_CACHE_SCHEMA}'
+        )
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.CACHE_DIR / f'{digest}.parquet', self.CACHE_DIR / f'{digest}.json'
+
+    def _load_cache(self, format: str | None) -> bool:
+        """Loads data and info from the cache. Returns False on a miss."""
+        data_path, info_path = self._cache_paths(format)
+        if not (data_path.exists() and info_path.exists()):
+            return False
+
+        try:
+            payload = json.loads(info_path.read_text(encoding='utf-8'))
+            self._parser = get_parser_instance(payload['parser'])
+            self._info = DataInfo(**payload['info'])
+            data = pd.read_parquet(data_path)
+            # Parquet widens some dtypes (datetime64[s] comes back as [ms])
+            for column, dtype in payload['dtypes'].items():
+                if str(data[column].dtype) != dtype:
+                    data[column] = data[column].astype(dtype)
+            self._data = data
+            # Mark the entry as recently used for eviction
+            os.utime(data_path)
+        except Exception:
+            return False
+        return True
+
+    def _store_cache(self, format: str | None):
+        """Writes the parsed data to the cache (best effort, errors are ignored)."""
+        data_path, info_path = self._cache_paths(format)
+        info = dataclasses.asdict(self._info)
+        info['units'] = dict(self._info.units.items())
+        dtypes = {str(column): str(dtype) for column, dtype in self._data.dtypes.items()}
+        payload = {'parser': self._parser.name, 'info': info, 'dtypes': dtypes}
+
+        try:
+            text = json.dumps(payload, default=_json_default)
+            # Skip files whose metadata does not survive a JSON round trip
+            if json.loads(text) != payload:
+                return
+
+            self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._data.to_parquet(data_path, compression='zstd')
+            info_path.write_text(text, encoding='utf-8')
+        except Exception:
+            # e.g. non-string column names or mixed-type columns
+            data_path.unlink(missing_ok=True)
+            info_path.unlink(missing_ok=True)
+            return
+
+        self._prune_cache()
+
+    @classmethod
+    def _prune_cache(cls):
+        """Evicts the least recently used entries while the cache exceeds CACHE_MAX_BYTES."""
+        try:
+            entries = []
+            for data_path in cls.CACHE_DIR.glob('*.parquet'):
+                info_path = data_path.with_suffix('.json')
+                stat = data_path.stat()
+                size = stat.st_size + (info_path.stat().st_size if info_path.exists() else 0)
+                entries.append((stat.st_mtime, size, data_path, info_path))
+
+            total = sum(entry[1] for entry in entries)
+            for _, size, data_path, info_path in sorted(entries):
+                if total <= cls.CACHE_MAX_BYTES:
+                    break
+                data_path.unlink(missing_ok=True)
+                info_path.unlink(missing_ok=True)
+                total -= size
+        except OSError:
+            # Best effort, like the cache writes: e.g. a concurrent load pruned first
+            pass
+
+    @classmethod
+    def clear_cache(cls) -> int:
+        """
+        Deletes every cached file from CACHE_DIR.
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        removed = 0
+        for data_path in cls.CACHE_DIR.glob('*.parquet'):
+            data_path.unlink(missing_ok=True)
+            data_path.with_suffix('.json').unlink(missing_ok=True)
+            removed += 1
+        for info_path in cls.CACHE_DIR.glob('*.json'):
+            info_path.unlink(missing_ok=True)
+        return removed
+
     def _auto_detect(self) -> BaseParser:
         """Automatically detects the file format."""
+        # Parsers that cannot read this extension are skipped without
+        # touching the file. The rest share one lazy header snapshot (a workbook
+        # is only opened by a parser that needs its rows) and run detect() by
+        # priority, registry order breaking ties, so the first match still wins.
+        # Results are memoized per file state, so reopening an unchanged file
+        # does no I/O.
+        suffix = self.filepath.suffix.lower()
+        candidates = {}
         for name, parser_class in PARSERS.items():
-            parser = parser_class()
-            if parser.detect(str(self.filepath)):
+            # Aliases map to the same class; detect() once per class
+            if suffix in parser_class.supported_suffixes:
+                candidates.setdefault(parser_class, name)
+
+        file_key = _file_key(str(self.filepath))
+        probe = FileProbe(str(self.filepath))
+        prefetched = False
+
+        for parser_class, name in sorted(candidates.items(), key=lambda c: c[0].priority):
+            parser = get_parser_instance(name)
+            if not prefetched and not _is_detect_cached(parser.name, file_key):
+                # First cache miss: fetch the header I/O before detect() runs
+                probe.prefetch()
+                prefetched = True
+            if parser.detect_cached(str(self.filepath), probe, file_key):
                 return parser
 
         raise ValueError(
@@ -101,35 +365,29 @@ class DataLoader:
         """
         Generates a time axis based on the time step.
 
+        The axis is kept as a lazy _TimeAxis; it is only written into the
+        DataFrame when `data` is accessed.
+
         Args:
             time_step: Time interval between samples (in time_unit)
             time_unit: Unit of the time_step ('ms', 's', 'min', 'h')
             display_unit: Unit to display on the axis ('ms', 's', 'min', 'h')
         """
-        n_points = len(self._data)
-
-        # Calculate time values in the original unit
-        time_values = np.arange(n_points) * time_step
-
-        # Convert to display unit if different
-        if time_unit != display_unit:
-            # First convert to seconds, then to display unit
-            time_in_seconds = time_values * self.TIME_CONVERSIONS.get(time_unit, 1.0)
-            time_values = time_in_seconds / self.TIME_CONVERSIONS.get(display_unit, 1.0)
+        # Fold the unit conversion into a single scalar step
+        # (time_unit -> seconds -> display_unit)
+        effective_step = (
+            time_step
+            * self.TIME_CONVERSIONS.get(time_unit, 1.0)
+            / self.TIME_CONVERSIONS.get(display_unit, 1.0)
+        )
 
         # Create column name with display unit
         time_col_name = f'Time ({display_unit})'
+        self._time_axis = _TimeAxis(len(self._data), effective_step, time_col_name)
 
-        # Insert time column at the beginning
+        # Existing time column is replaced when the axis is materialized
         if self._info.time_column and self._info.time_column in self._data.columns:
-            # Replace existing time column
-            old_time_col = self._info.time_column
-            col_idx = self._data.columns.get_loc(old_time_col)
-            self._data.drop(columns=[old_time_col], inplace=True)
-            self._data.insert(col_idx, time_col_name, time_values)
-        else:
-            # Insert new time column at the beginning
-            self._data.insert(0, time_col_name, time_values)
+            self._replaced_time_column = self._info.time_column
 
         # Update info
         self._info.time_column = time_col_name
@@ -139,9 +397,30 @@ class DataLoader:
         if time_step_in_seconds > 0:
             self._info.sample_rate = 1.0 / time_step_in_seconds
 
+    def _materialize_time_axis(self):
+        """Writes the lazy time axis into the DataFrame."""
+        time_values = self._time_axis.to_numpy()
+        time_col_name = self._time_axis.name
+
+        # Insert time column at the beginning
+        if self._replaced_time_column is not None:
+            # Replace existing time column
+            old_time_col = self._replaced_time_column
+            col_idx = self._data.columns.get_loc(old_time_col)
+            self._data.drop(columns=[old_time_col], inplace=True)
+            self._data.insert(col_idx, time_col_name, time_values)
+        else:
+            # Insert new time column at the beginning
+            self._data.insert(0, time_col_name, time_values)
+
+        self._time_axis = None
+        self._replaced_time_column = None
+
     @property
     def data(self) -> pd.DataFrame:
-        """Returns the DataFrame with data."""
+        """Returns the DataFrame with data (materializes a generated time axis)."""
+        if self._time_axis is not None:
+            self._materialize_time_axis()
         return self._data
 
     @property
@@ -152,14 +431,21 @@ class DataLoader:
     @property
     def columns(self) -> list:
         """Lists all data columns (excluding time)."""
-        time_col = self._info.time_column
-        return [c for c in self._data.columns if c != time_col]
+        time_cols = (self._info.time_column, self._replaced_time_column)
+        return [c for c in self._data.columns if c not in time_cols]
 
     @property
-    def time(self) -> pd.Series | None:
-        """Returns the time column, if it exists."""
+    def time(self) -> pd.Series | _TimeAxis | None:
+        """
+        Returns the time column, if it exists.
+
+        A time axis generated from `time_step` is returned as a lazy,
+        array-like _TimeAxis until `data` is accessed.
+        """
+        if self._time_axis is not None:
+            return self._time_axis
         if self._info.time_column:
-            return self._data[self._info.time_column]
+            return self[self._info.time_column]
         return None
 
     @property
@@ -179,25 +465,43 @@ class DataLoader:
 
     def __getitem__(self, key):
         """Direct column access: loader['column']"""
+        if self._time_axis is not None and key == self._time_axis.name:
+            return self._time_axis.to_series()
         return self._data[key]
 
     def __repr__(self):
+        n_rows, n_cols = self._data.shape
+        if self._time_axis is not None and self._replaced_time_column is None:
+            n_cols += 1
         return (
             f"DataLoader(\n"
             f"  file='{self.filepath.name}',\n"
             f"  format='{self._parser.name}',\n"
-            f"  shape={self._data.shape},\n"
+            f"  shape={(n_rows, n_cols)},\n"
             f"  columns={len(self.columns)}\n"
             f")"
         )
 
     def head(self, n: int = 5) -> pd.DataFrame:
         """Shows the first n rows."""
-        return self._data.head(n)
+        return self.data.head(n)
 
-    def describe(self) -> pd.DataFrame:
-        """Descriptive statistics of the data."""
-        return self._data.describe()
+    def describe(self, percentiles: bool | list = False, include=None) -> pd.DataFrame:
+        """
+        Descriptive statistics of the data.
+
+        Args:
+            percentiles: False (default) skips the percentile rows, which
+                         dominate the runtime on wide files (pandas < 3 still
+                         reports the median). True restores the 25%/50%/75%
+                         rows, and a list of fractions selects others
+            include: Passed to pd.DataFrame.describe (e.g. 'all')
+        """
+        if percentiles is True:
+            percentiles = None
+        elif percentiles is False:
+            percentiles = []
+        return self.data.describe(percentiles=percentiles, include=include)
 
     def get_channel(self, pattern: str) -> list:
         """
@@ -209,6 +513,11 @@ class DataLoader:
         Returns:
             list: List of matching columns
         """
-        import re
-        regex = re.compile(pattern, re.IGNORECASE)
-        return [c for c in self.columns if regex.search(str(c))]
+        regex = _compile(pattern)
+
+        # Rebuild the channel tuple only when the DataFrame columns changed
+        if self._columns_index is not self._data.columns:
+            self._columns_index = self._data.columns
+            self._columns_tuple = tuple((c, str(c)) for c in self.columns)
+
+        return [c for c, name in self._columns_tuple if regex.search(name)]
@@ -45,6 +45,21 @@ def get_parser(name: str) -> type:
     return PARSERS[name_lower]
 
 
+# Parser instances, created on first use and shared by all loaders.
+# Parsers keep no per-file state, so one instance per class is enough;
+# aliases such as 'keysight' and 'keysight_34970a' share it.
+_PARSER_INSTANCES: dict[type, BaseParser] = {}
+
+
+def get_parser_instance(name: str) -> BaseParser:
+    """Returns the shared parser instance by name."""
+    parser_class = get_parser(name)
+    parser = _PARSER_INSTANCES.get(parser_class)
+    if parser is None:
+        parser = _PARSER_INSTANCES.setdefault(parser_class, parser_class())
+    return parser
+
+
 def list_parsers() -> list:
     """Lists all available parsers."""
     return list(PARSERS.keys())
@@ -62,6 +77,7 @@ __all__ = [
     'KeithleyParser',
     'GenericCSVParser',
     'get_parser',
+    'get_parser_instance',
     'list_parsers',
     'PARSERS',
 ]
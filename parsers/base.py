@@ -3,10 +3,56 @@ Base class for data parsers.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Optional
+import datetime
+import functools
+import importlib.util
+import io
+import itertools
+import mmap
+import os
+from pathlib import Path
+import re
+import threading
+from typing import Iterable, Iterator, Optional, Sequence
+import xml.etree.ElementTree as ET
+import zipfile
+import numpy as np
+import openpyxl
 import pandas as pd
 
+# Suffixes handled as Excel workbooks
+EXCEL_SUFFIXES = ('.xlsx', '.xlsm', '.xls')
+
+# File signatures of .xlsx/.xlsm (ZIP) and legacy .xls (OLE2) workbooks
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE_MAGIC = b'\xd0\xcf\x11\xe0'
+
+# Optional pyarrow: multi-threaded CSV engine and Parquet support
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Optional python-calamine: Rust Excel reader, much faster than openpyxl
+# on full-sheet reads and able to read legacy .xls files
+_HAS_CALAMINE = importlib.util.find_spec('python_calamine') is not None
+
+# Files above this size are memory-mapped for header sniffing
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Bytes read from the start of a file for detection and header scans
+_HEADER_BYTES = 8192
+
+# ISO 8601 timestamps ("2024-03-04 10:00:00", "2024-03-04T10:00:00.123")
+_ISO_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}', re.ASCII)
+
+# detect() results keyed by (parser name, path, mtime_ns, size); see BaseParser.detect_cached
+_DETECT_CACHE: OrderedDict = OrderedDict()
+_DETECT_CACHE_SIZE = 1024
+_DETECT_CACHE_LOCK = threading.Lock()
+
+# "Name (unit)" and "Name [unit]" column headers
+_UNIT_RE = re.compile(r'(?P<name>.+?)\s*(?:\((?P<u1>[^)]+)\)|\[(?P<u2>[^\]]+)\])')
+
 
 @dataclass
 class DataInfo:
@@ -17,9 +63,21 @@ class DataInfo:
     channels: list = field(default_factory=list)
     time_column: Optional[str] = None
     sample_rate: Optional[float] = None
-    units: dict = field(default_factory=dict)
+    units: pd.Series = field(default_factory=lambda: pd.Series(dtype='category'))
     metadata: dict = field(default_factory=dict)
 
+    def __post_init__(self):
+        # Units are stored column-oriented: one categorical Series indexed by
+        # channel name, so repeated unit strings are kept once. Parsers may
+        # still pass a {column: unit} dict.
+        if not isinstance(self.units, pd.Series):
+            units = dict(self.units)
+            self.units = pd.Series(
+                list(units.values()),
+                index=pd.Index(list(units.keys()), dtype=object),
+                dtype='category',
+            )
+
     def __repr__(self):
         return (
             f"DataInfo(\n"
@@ -31,12 +89,333 @@ class DataInfo:
         )
 
 
+def _downcast_numeric(df: pd.DataFrame, exclude: Iterable = ()) -> pd.DataFrame:
+    """
+    Stores float64 columns as float32 and int64 columns as int32, in place.
+
+    Halves the memory (and memory traffic) of typical logger data. Floats
+    are only downcast when every value fits the float32 range; float32
+    keeps about 7 significant digits. Columns in `exclude` (the time
+    column) are left alone.
+    """
+    skip = set(exclude)
+    int32 = np.iinfo(np.int32)
+    for i, (col, dtype) in enumerate(zip(df.columns, df.dtypes)):
+        if col in skip:
+            continue
+        if dtype == np.float64:
+            df.isetitem(i, pd.to_numeric(df.iloc[:, i], downcast='float'))
+        elif dtype == np.int64:
+            values = df.iloc[:, i]
+            if values.empty or (values.min() >= int32.min and values.max() <= int32.max):
+                df.isetitem(i, values.astype(np.int32))
+    return df
+
+
+def _times_to_text(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns time-of-day columns back into text, in place.
+
+    pyarrow infers "HH:MM:SS" columns as datetime.time objects, which
+    pd.to_datetime rejects; as text they parse like a C engine read.
+    """
+    for i, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        col = df.iloc[:, i]
+        first = col.first_valid_index()
+        if first is not None and isinstance(col.loc[first], datetime.time):
+            df.isetitem(i, col.astype(str))
+    return df
+
+
+def _file_key(filepath: str) -> Optional[tuple]:
+    """(absolute path, mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return os.path.abspath(filepath), st.st_mtime_ns, st.st_size
+
+
+def _is_detect_cached(parser_name: str, file_key: Optional[tuple]) -> bool:
+    """True if BaseParser.detect_cached has a result for this parser and file state."""
+    return file_key is not None and (parser_name, *file_key) in _DETECT_CACHE
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_header_bytes(filepath: str, mtime_ns: int, n_bytes: int) -> bytes:
+    """Reads the first bytes of a file; cached per (path, mtime, size read)."""
+    with open(filepath, 'rb') as f:
+        return f.read(n_bytes)
+
+
+def _read_header_bytes(filepath: str, n_bytes: int = _HEADER_BYTES) -> bytes:
+    """
+    Returns the first `n_bytes` of a file (empty if it cannot be read).
+
+    Memoized on the modification time, so every detect() and header sniff
+    of the same file shares one read until the file changes.
+    """
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        return _cached_header_bytes(os.path.abspath(filepath), mtime_ns, n_bytes)
+    except OSError:
+        return b''
+
+
+def _sheet_names_fast(filepath: str) -> Optional[list]:
+    """
+    Reads the sheet names of an .xlsx file straight from xl/workbook.xml.
+
+    Only that small XML part is inflated from the ZIP archive; styles,
+    shared strings and worksheets are never touched. Legacy .xls files are
+    handled by python-calamine when it is installed. Returns None when the
+    names cannot be read this way.
+    """
+    if Path(filepath).suffix.lower() == '.xls':
+        if not _HAS_CALAMINE:
+            return None
+        from python_calamine import CalamineWorkbook
+        try:
+            with CalamineWorkbook.from_path(filepath) as wb:
+                return list(wb.sheet_names) or None
+        except Exception:
+            return None
+
+    try:
+        with zipfile.ZipFile(filepath) as zf, zf.open('xl/workbook.xml') as f:
+            tree = ET.parse(f)
+    except (zipfile.BadZipFile, KeyError, OSError, ET.ParseError):
+        return None
+
+    # Namespace wildcard covers both transitional and strict OOXML
+    names = [sheet.get('name') for sheet in tree.getroot().iterfind('{*}sheets/{*}sheet')]
+    return names or None
+
+
+def _calamine_value(value):
+    """Converts a python-calamine cell to what openpyxl would return."""
+    if isinstance(value, str):
+        return None if value == '' else value
+    if isinstance(value, float) and value.is_integer():
+        # Excel stores every number as a float; keep integers as int
+        return int(value)
+    return value
+
+
+def _calamine_rows(
+    filepath: str, sheet_name: int | str = 0, max_row: Optional[int] = None
+) -> list:
+    """Reads the rows of a sheet with python-calamine, empty cells as None."""
+    from python_calamine import CalamineWorkbook
+
+    with CalamineWorkbook.from_path(filepath) as wb:
+        if isinstance(sheet_name, int):
+            ws = wb.get_sheet_by_index(sheet_name)
+        else:
+            ws = wb.get_sheet_by_name(sheet_name)
+        # skip_empty_area=False keeps leading empty rows, so row numbers match
+        return [
+            tuple(_calamine_value(v) for v in row)
+            for row in ws.to_python(skip_empty_area=False, nrows=max_row)
+        ]
+
+
+@dataclass
+class FileProbe:
+    """
+    Header snapshot of a file, shared by all parsers during auto-detection.
+
+    The workbook is opened once (read-only) on first access and the first
+    `n_rows` rows of every sheet are kept, so each parser's detect() is a
+    lookup instead of a new Excel parse. The first `n_bytes` of the raw
+    file are cached the same way for text formats.
+    """
+    filepath: str
+    n_rows: int = 20
+    n_bytes: int = _HEADER_BYTES
+    _sheet_names: Optional[list] = field(default=None, init=False, repr=False)
+    _header_rows: Optional[dict] = field(default=None, init=False, repr=False)
+    _header_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+    _shared_strings: Optional[bytes] = field(default=None, init=False, repr=False)
+    _raw_lines: Optional[list] = field(default=None, init=False, repr=False)
+    _text_lines: list = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def suffix(self) -> str:
+        """Lowercase file extension."""
+        return Path(self.filepath).suffix.lower()
+
+    @property
+    def sheet_names(self) -> list:
+        """Sheet names of the workbook (empty for non-Excel files)."""
+        if self._sheet_names is None:
+            names = _sheet_names_fast(self.filepath) if self.suffix in EXCEL_SUFFIXES else None
+            if names is None:
+                self._load_workbook()
+            else:
+                self._sheet_names = names
+        return self._sheet_names
+
+    @property
+    def header_rows(self) -> dict:
+        """First rows of each sheet as lists of cell values, keyed by sheet name."""
+        if self._header_rows is None:
+            self._load_workbook()
+        return self._header_rows
+
+    @property
+    def header_bytes(self) -> bytes:
+        """First `n_bytes` of the raw file."""
+        if self._header_bytes is None:
+            self._read_header_bytes()
+        return self._header_bytes
+
+    @property
+    def is_excel(self) -> bool:
+        """
+        True if the file has an Excel extension and a workbook signature.
+
+        Checked on the cached header bytes, so renamed or truncated files are
+        rejected without starting an Excel reader.
+        """
+        if self.suffix in ('.xlsx', '.xlsm'):
+            return self.header_bytes.startswith(_ZIP_MAGIC)
+        if self.suffix == '.xls':
+            # Some tools write .xlsx content with an .xls name
+            return self.header_bytes.startswith((_OLE_MAGIC, _ZIP_MAGIC))
+        return False
+
+    def header_text(self, n_lines: int) -> str:
+        """
+        First `n_lines` lines of the file, decoded as UTF-8 and lowercased.
+
+        Lines are decoded on first request only, and shared by every
+        parser's marker scan. Undecodable bytes are dropped; ASCII markers
+        survive any single-byte or Shift-JIS encoding this way.
+        """
+        if self._raw_lines is None:
+            self._raw_lines = self.header_bytes.splitlines(keepends=True)
+        for raw in self._raw_lines[len(self._text_lines):n_lines]:
+            self._text_lines.append(raw.decode('utf-8', errors='ignore').lower())
+        return ''.join(self._text_lines[:n_lines])
+
+    @property
+    def shared_strings(self) -> bytes:
+        """
+        Lowercased head (64 KB) of xl/sharedStrings.xml, empty when unavailable.
+
+        Text cells of an .xlsx workbook are stored there, so a marker scan
+        over it needs no worksheet parsing at all.
+        """
+        if self._shared_strings is None:
+            self._shared_strings = b''
+            if self.suffix in ('.xlsx', '.xlsm'):
+                try:
+                    with zipfile.ZipFile(self.filepath) as zf, \
+                            zf.open('xl/sharedStrings.xml') as f:
+                        self._shared_strings = f.read(65536).lower()
+                except (zipfile.BadZipFile, KeyError, OSError):
+                    pass
+        return self._shared_strings
+
+    def prefetch(self) -> 'FileProbe':
+        """
+        Loads the header bytes every parser's detection starts from.
+
+        The workbook snapshot is deliberately left out: sheet names, shared
+        strings and header rows stay lazy, so only a parser that actually
+        needs cell values pays for the full workbook load. Returns the probe
+        itself.
+        """
+        if self._header_bytes is None:
+            self._read_header_bytes()
+        return self
+
+    def rows(self, sheet: int | str = 0) -> list:
+        """Returns the header rows of a sheet, by position or name."""
+        if isinstance(sheet, int):
+            if sheet >= len(self.sheet_names):
+                return []
+            sheet = self.sheet_names[sheet]
+        return self.header_rows.get(sheet, [])
+
+    def _read_header_bytes(self):
+        """Reads the first `n_bytes` of the file."""
+        self._header_bytes = _read_header_bytes(self.filepath, self.n_bytes)
+
+    def _load_workbook(self):
+        """Opens the workbook once and snapshots the header rows of every sheet."""
+        names, rows = [], {}
+        if self.suffix in EXCEL_SUFFIXES:
+            try:
+                names, rows = self._snapshot_workbook()
+            except Exception:
+                # Unreadable workbook: every parser will simply not match
+                names, rows = [], {}
+
+        self._header_rows = rows
+        if self._sheet_names is None:
+            self._sheet_names = names
+
+    def _snapshot_workbook(self) -> tuple[list, dict]:
+        """Returns (sheet names, {sheet: first rows}) of the workbook."""
+        if self.suffix == '.xls' and _HAS_CALAMINE:
+            names = _sheet_names_fast(self.filepath) or []
+            rows = {
+                name: [list(row) for row in _calamine_rows(self.filepath, name, self.n_rows)]
+                for name in names
+            }
+            return names, rows
+
+        if self.suffix == '.xls':
+            # openpyxl cannot read legacy .xls; let pandas pick the engine
+            sheets = pd.read_excel(self.filepath, sheet_name=None, header=None, nrows=self.n_rows)
+            rows = {
+                name: df.astype(object).where(df.notna(), None).values.tolist()
+                for name, df in sheets.items()
+            }
+            return list(sheets), rows
+
+        wb = openpyxl.load_workbook(self.filepath, read_only=True, data_only=True)
+        try:
+            rows = {
+                ws.title: [
+                    list(row) for row in ws.iter_rows(max_row=self.n_rows, values_only=True)
+                ]
+                for ws in wb.worksheets
+            }
+            return list(wb.sheetnames), rows
+        finally:
+            wb.close()
+
+
 class BaseParser(ABC):
     """Abstract base class for data parsers."""
 
     name: str = "base"
     description: str = "Base parser"
 
+    # File extensions this parser can read; auto-detection skips the others
+    supported_suffixes: frozenset = frozenset({'.csv', '.txt', '.xls', '.xlsx'})
+
+    # Auto-detection order: lower values are tried first, ties keep registry order
+    priority: int = 0
+
+    # Lowercase keywords identifying the format in a text export header.
+    # Compiled into a single alternation per class, so the header is
+    # scanned once instead of once per marker.
+    markers: tuple = ()
+    _marker_re: Optional[re.Pattern] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'markers' in cls.__dict__:
+            cls._marker_re = (
+                re.compile('|'.join(map(re.escape, cls.markers))) if cls.markers else None
+            )
+
     @abstractmethod
     def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
         """
@@ -47,32 +426,97 @@ class BaseParser(ABC):
         """
         pass
 
+    def parse_stream(
+        self, filepath: str, chunksize: int = 1_000_000
+    ) -> Iterator[tuple[pd.DataFrame, DataInfo]]:
+        """
+        Reads the file in chunks of at most `chunksize` rows.
+
+        Parsers that can read incrementally override this so very large logs
+        never have to fit in memory at once. The default parses the whole file
+        and yields it in slices. Stopping the iteration early aborts the read.
+
+        Yields:
+            tuple: (DataFrame chunk, DataInfo shared by all chunks)
+        """
+        df, info = self.parse(filepath)
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start:start + chunksize], info
+
     @abstractmethod
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: Optional[FileProbe] = None) -> bool:
         """
         Detects if the file is compatible with this parser.
 
+        Args:
+            filepath: Path to the file
+            probe: Shared header snapshot built by the loader (optional)
+
         Returns:
             bool: True if file is compatible
         """
         pass
 
+    def detect_cached(
+        self, filepath: str, probe: Optional[FileProbe] = None, file_key: Optional[tuple] = None
+    ) -> bool:
+        """
+        detect(), memoized on (parser, path, modification time, size).
+
+        Repeated checks of an unchanged file (file tree refresh, reopen,
+        preview) become a dictionary lookup; editing the file invalidates
+        the entry. The most recent 1024 results are kept.
+
+        Args:
+            filepath: Path to the file
+            probe: Shared header snapshot, used on a cache miss (optional)
+            file_key: Precomputed (absolute path, mtime_ns, size), e.g. from a
+                      directory listing, to skip the stat call (optional)
+        """
+        file_key = file_key or _file_key(filepath)
+        if file_key is None:
+            return False
+
+        key = (self.name, *file_key)
+        with _DETECT_CACHE_LOCK:
+            result = _DETECT_CACHE.get(key)
+            if result is not None:
+                _DETECT_CACHE.move_to_end(key)
+                return result
+
+        result = self.detect(filepath, probe)
+
+        with _DETECT_CACHE_LOCK:
+            _DETECT_CACHE[key] = result
+            if len(_DETECT_CACHE) > _DETECT_CACHE_SIZE:
+                _DETECT_CACHE.popitem(last=False)
+        return result
+
     def _parse_time_column(self, df: pd.DataFrame, time_col: str) -> pd.DataFrame:
-        """Attempts to convert time column to datetime or timedelta."""
+        """
+        Attempts to convert time column to datetime or numeric (seconds).
+
+        Each conversion is tried on the first rows before the whole column,
+        so a column that is clearly not a date is rejected without scanning
+        every row.
+        """
         if time_col not in df.columns:
             return df
 
         col = df[time_col]
+        head = col.iloc[:5]
 
         # Try to convert to datetime
         try:
-            df[time_col] = pd.to_datetime(col)
+            pd.to_datetime(head)
+            df[time_col] = self._to_datetime(col)
             return df
         except (ValueError, TypeError):
             pass
 
         # Try to convert to numeric (seconds)
         try:
+            pd.to_numeric(head)
             df[time_col] = pd.to_numeric(col)
             return df
         except (ValueError, TypeError):
@@ -80,14 +524,228 @@ class BaseParser(ABC):
 
         return df
 
+    def _find_column(
+        self, columns: Sequence, keywords: Sequence[str], exact: Sequence[str] = ()
+    ) -> Optional[str]:
+        """
+        First column whose lowercased name contains one of `keywords`, or
+        equals one of `exact`; None if there is none.
+
+        The names are converted and matched all at once with the .str
+        accessor instead of a str()/lower() per column.
+        """
+        names = pd.Index(columns).astype(str).str.lower()
+        mask = np.asarray(names.str.contains('|'.join(map(re.escape, keywords))), dtype=bool)
+        if exact:
+            mask |= names.isin(list(exact))
+        return columns[int(mask.argmax())] if mask.any() else None
+
+    def _has_marker(self, text: str) -> bool:
+        """True if the lowercased text contains any of the parser's markers."""
+        return self._marker_re is not None and self._marker_re.search(text) is not None
+
+    def _header_has_marker(self, probe: FileProbe, n_lines: int) -> bool:
+        """
+        True if one of the first `n_lines` lines of the file has a marker.
+
+        The first line (vendor tag or column header in most exports) is
+        checked on its own first; the rest of the header is only decoded
+        and scanned when it is inconclusive.
+        """
+        first = probe.header_text(1)
+        if self._has_marker(first):
+            return True
+        return self._has_marker(probe.header_text(n_lines)[len(first):])
+
+    def _to_datetime(self, col: pd.Series) -> pd.Series:
+        """
+        Converts a column to datetime with a format hint when possible.
+
+        ISO 8601 text is parsed with format='ISO8601' (pandas' fast ISO
+        path); anything else falls back to format inference. cache=True
+        parses repeated timestamps only once.
+        """
+        sample = col.iloc[:5].dropna()
+        first = sample.iloc[0] if len(sample) else None
+        if isinstance(first, str) and _ISO_DATETIME_RE.match(first.strip()):
+            try:
+                return pd.to_datetime(col, format='ISO8601', cache=True)
+            except (ValueError, TypeError):
+                pass
+        return pd.to_datetime(col, cache=True)
+
+    def _read_csv(self, filepath: str, **kwargs) -> pd.DataFrame:
+        """
+        Reads a CSV file with the pyarrow engine when it is installed.
+
+        pyarrow parses columns in parallel and is several times faster than
+        the C engine on large numeric files. Falls back to the C engine when
+        pyarrow is missing or rejects the file or one of the options. Time of
+        day columns are returned as text, as the C engine reads them.
+        """
+        if _HAS_PYARROW:
+            arrow_kwargs = dict(kwargs)
+            # pyarrow does its own I/O and rejects memory_map
+            arrow_kwargs.pop('memory_map', None)
+            # pandas maps skiprows to pyarrow's skip_rows_after_names; skipping
+            # lines before the header row is expressed with header=N instead
+            skiprows = arrow_kwargs.get('skiprows')
+            if isinstance(skiprows, int) and arrow_kwargs.get('header', 0) == 0:
+                arrow_kwargs['header'] = arrow_kwargs.pop('skiprows')
+            try:
+                return _times_to_text(pd.read_csv(filepath, engine='pyarrow', **arrow_kwargs))
+            except Exception:
+                pass
+        return pd.read_csv(filepath, **kwargs)
+
+    def _read_head_lines(self, filepath: str, n_lines: int) -> list:
+        """
+        Returns the first `n_lines` raw lines (bytes) of a file.
+
+        Files larger than 64 KB are memory-mapped, so the pages read here are
+        already in the OS page cache when pandas maps the file again with
+        read_csv(memory_map=True).
+        """
+        path = Path(filepath)
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if path.suffix.lower() != '.gz' and size > _MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return list(itertools.islice(iter(mm.readline, b''), n_lines))
+            return list(itertools.islice(f, n_lines))
+
+    def _header_lines(self, filepath: str, n_lines: int, encoding: str = 'utf-8') -> list:
+        """
+        Returns the first `n_lines` lines of a text file, decoded.
+
+        Served from the header bytes detect() already read (cached per file
+        modification time), so parse() does not open and decode the file a
+        second time. Falls back to reading the file when the lines are wider
+        than that header. Undecodable bytes are dropped and line endings are
+        normalized to '\\n', as in a text-mode open(errors='ignore').
+        """
+        blob = _read_header_bytes(filepath)
+        lines = io.StringIO(blob.decode(encoding, errors='ignore'), newline=None).readlines()
+        if len(blob) == _HEADER_BYTES:
+            # The header read may have cut the last line
+            lines = lines[:-1]
+            if len(lines) < n_lines:
+                with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
+                    return list(itertools.islice(f, n_lines))
+        return lines[:n_lines]
+
+    def _first_match_line(
+        self, lines: Sequence[str], pattern: re.Pattern, start: int = 0
+    ) -> Optional[int]:
+        """
+        Index of the first line from `start` on that begins with `pattern`.
+
+        The lines are searched as one string in a single regex scan instead of
+        a match() per line; `pattern` must be compiled with re.MULTILINE.
+
+        Returns:
+            int | None: line index, or None if no line matches
+        """
+        text = ''.join(lines)
+        match = pattern.search(text, sum(map(len, lines[:start])))
+        return None if match is None else text.count('\n', 0, match.start())
+
+    def _read_excel_rows(
+        self, filepath: str, sheet_name: int | str = 0, max_row: Optional[int] = None
+    ) -> Iterator[tuple]:
+        """
+        Streams the rows of a sheet as tuples of cell values.
+
+        Full-sheet reads use python-calamine when it is installed. Otherwise,
+        and for bounded header reads (openpyxl streams, calamine parses the
+        whole sheet), .xlsx files are opened with openpyxl in read-only mode
+        (no styles, cached formula values only). Legacy .xls files go through
+        calamine or pandas.
+        """
+        suffix = Path(filepath).suffix.lower()
+        if _HAS_CALAMINE and (max_row is None or suffix == '.xls'):
+            yield from _calamine_rows(filepath, sheet_name, max_row)
+            return
+
+        if suffix == '.xls':
+            df = pd.read_excel(filepath, sheet_name=sheet_name, header=None, nrows=max_row)
+            yield from df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            return
+
+        wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        try:
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            yield from ws.iter_rows(max_row=max_row, values_only=True)
+        finally:
+            wb.close()
+
+    def _header_names(self, header: Sequence) -> list:
+        """
+        Column names for a raw header row, following pd.read_excel.
+
+        Empty headers (None or NaN) become "Unnamed: N" and duplicates get
+        a ".N" suffix.
+        """
+        columns = []
+        seen = {}
+        for i, name in enumerate(header):
+            if name is None or (isinstance(name, float) and name != name):
+                name = f'Unnamed: {i}'
+            if name in seen:
+                seen[name] += 1
+                name = f'{name}.{seen[name]}'
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
+
+    def _rows_to_frame(self, header: Sequence, rows: Iterable[Sequence]) -> pd.DataFrame:
+        """
+        Builds a DataFrame from raw sheet rows.
+
+        Column names follow pd.read_excel (see _header_names). Trailing
+        empty rows are dropped.
+        """
+        columns = self._header_names(header)
+
+        data = list(rows)
+        while data and all(v is None for v in data[-1]):
+            data.pop()
+
+        return pd.DataFrame.from_records(data, columns=columns)
+
+    @classmethod
+    def _extract_units_vectorized(cls, names: Sequence) -> tuple[list, pd.Series]:
+        """
+        Extracts units from a whole list of column names in one pass.
+
+        Vectorized equivalent of calling _extract_unit() per column.
+
+        Returns:
+            tuple: (names without the unit part, categorical Series of units
+                    indexed by the original column, for columns that have one)
+        """
+        labels = pd.Series([str(n) for n in names], dtype=object)
+        extracted = labels.str.extract(_UNIT_RE)
+
+        clean = extracted['name'].str.strip().fillna(labels)
+        unit = extracted['u1'].fillna(extracted['u2']).str.strip()
+        has_unit = (unit.notna() & (unit != '')).to_numpy()
+
+        units = pd.Series(
+            unit[has_unit].to_numpy(),
+            index=pd.Index(list(names), dtype=object)[has_unit],
+            dtype='category',
+        )
+        return clean.tolist(), units
+
     def _extract_unit(self, column_name: str) -> tuple[str, Optional[str]]:
         """
         Extracts unit from column name.
 
-        Example: "101 (VDC)" -> ("101", "VDC")
+        Example: "101 (VDC)" -> ("101", "VDC"), "CH1[V]" -> ("CH1", "V")
         """
-        import re
-        match = re.search(r'(.+?)\s*\(([^)]+)\)', column_name)
+        match = _UNIT_RE.search(column_name)
         if match:
-            return match.group(1).strip(), match.group(2).strip()
+            return match['name'].strip(), (match['u1'] or match['u2']).strip()
         return column_name, None
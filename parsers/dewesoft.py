@@ -4,13 +4,19 @@ Parser for Dewesoft (Datalogger) exported files.
 Format:
 - First sheet: metadata (root) with name in YYYYMMDD_HHMMSS format
 - Second sheet: "Data" with columns named as PREFIX_NN (e.g., NN_01, NN5494_01)
-- No explicit time column in data
+- No explicit time column in data (a "Sample" column with the sample
+  number is added and used as the time column)
 """
 
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from .base import BaseParser, DataInfo, FileProbe
+
+# Root sheet date (YYYYMMDD_HHMMSS), channel prefix and channel number
+_DATE_RE = re.compile(r'(\d{8}_\d{6})', re.ASCII)
+_PREFIX_RE = re.compile(r'([A-Za-z0-9]+)_\d+', re.ASCII)
+_SUFFIX_RE = re.compile(r'_(\d+)$', re.ASCII)
 
 
 class DewesoftParser(BaseParser):
@@ -18,12 +24,13 @@ class DewesoftParser(BaseParser):
 
     name = "dewesoft"
     description = "Parser for Dewesoft Datalogger exported files"
+    supported_suffixes = frozenset({'.xlsx', '.xlsm', '.xls'})
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Dewesoft file."""
         try:
-            xl = pd.ExcelFile(filepath)
-            sheet_names = xl.sheet_names
+            probe = probe or FileProbe(filepath)
+            sheet_names = probe.sheet_names
 
             # Check if it has "Data" sheet and a sheet with "(root)" in the name
             has_data = 'Data' in sheet_names
@@ -35,10 +42,11 @@ class DewesoftParser(BaseParser):
 
     def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
         """Reads Dewesoft file."""
-        xl = pd.ExcelFile(filepath)
+        # Sheet names come from the workbook index, without loading any sheet
+        probe = FileProbe(filepath)
 
         # Find metadata sheet (root)
-        root_sheet = next((s for s in xl.sheet_names if '(root)' in s), None)
+        root_sheet = next((s for s in probe.sheet_names if '(root)' in s), None)
 
         # Extract metadata
         metadata = {}
@@ -46,7 +54,7 @@ class DewesoftParser(BaseParser):
 
         if root_sheet:
             # Extract date from sheet name (format: YYYYMMDD_HHMMSS)
-            match = re.search(r'(\d{8}_\d{6})', root_sheet)
+            match = _DATE_RE.search(root_sheet)
             if match:
                 date_str = match.group(1)
                 try:
@@ -55,18 +63,20 @@ class DewesoftParser(BaseParser):
                 except ValueError:
                     acquisition_date = date_str
 
-            # Read metadata from root sheet
-            df_root = pd.read_excel(filepath, sheet_name=root_sheet, nrows=10)
-            metadata['root_name'] = df_root.iloc[0, 0] if len(df_root) > 0 else None
+            # Read metadata from root sheet (first row after the header)
+            root_rows = list(self._read_excel_rows(filepath, sheet_name=root_sheet, max_row=2))
+            metadata['root_name'] = root_rows[1][0] if len(root_rows) > 1 else None
 
-        # Read data
-        df = pd.read_excel(filepath, sheet_name='Data')
+        # Read data, streaming rows instead of loading the full workbook model
+        rows = self._read_excel_rows(filepath, sheet_name='Data')
+        header = next(rows)
+        df = self._rows_to_frame(header, rows)
 
         # Identify column pattern (PREFIX_NN)
         columns = list(df.columns)
         prefix = None
         if columns:
-            match = re.match(r'([A-Za-z0-9]+)_\d+', columns[0])
+            match = _PREFIX_RE.match(columns[0])
             if match:
                 prefix = match.group(1)
                 metadata['channel_prefix'] = prefix
@@ -81,7 +91,8 @@ class DewesoftParser(BaseParser):
             acquisition_date=acquisition_date,
             channels=columns,
             time_column='Sample',
-            units={col: 'V' for col in columns},  # Assumes voltage by default
+            # Assumes voltage by default: one category shared by all channels
+            units=pd.Series('V', index=pd.Index(columns), dtype='category'),
             metadata=metadata
         )
 
@@ -93,15 +104,12 @@ class DewesoftParser(BaseParser):
 
         Example: NN_01 to NN_10 -> group 1, NN_11 to NN_20 -> group 2
         """
-        groups = {}
-        for col in df.columns:
-            if col == 'Sample':
-                continue
-            match = re.search(r'_(\d+)$', col)
-            if match:
-                num = int(match.group(1))
-                group_num = (num - 1) // 10 + 1
-                if group_num not in groups:
-                    groups[group_num] = []
-                groups[group_num].append(col)
-        return groups
+        columns = pd.Series(df.columns[df.columns != 'Sample'], dtype=object)
+
+        # Extract all numeric suffixes in one vectorized pass
+        numbers = columns.astype(str).str.extract(_SUFFIX_RE, expand=False)
+        has_number = numbers.notna()
+        group_ids = (numbers[has_number].astype(int) - 1) // 10 + 1
+
+        grouped = columns[has_number].groupby(group_ids, sort=False)
+        return {int(group_num): cols.tolist() for group_num, cols in grouped}
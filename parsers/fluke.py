@@ -11,10 +11,16 @@ Format:
 - Timestamp and channel readings
 """
 
+import itertools
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from .base import BaseParser, DataInfo, FileProbe
+
+# Header line patterns
+_MODEL_RE = re.compile(r'(\d{4}[a-z]?)', re.ASCII)
+_DATE_RE = re.compile(r'(\d{4}[/-]\d{2}[/-]\d{2})', re.ASCII)
+_NUMERIC_LINE_RE = re.compile(r'^[\d.,-]+', re.ASCII | re.MULTILINE)
 
 
 class FlukeParser(BaseParser):
@@ -22,36 +28,29 @@ class FlukeParser(BaseParser):
 
     name = "fluke"
     description = "Parser for Fluke Hydra datalogger exports"
+    markers = ('fluke', 'hydra', '2680', '2686', '2638', '1620', '1621', 'dewk')
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Fluke file."""
         try:
             path = Path(filepath)
             suffix = path.suffix.lower()
 
             if suffix in ['.csv', '.txt']:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    header_lines = [f.readline() for _ in range(15)]
-                    header_text = ''.join(header_lines).lower()
-
-                    fluke_markers = [
-                        'fluke',
-                        'hydra',
-                        '2680',
-                        '2686',
-                        '2638',
-                        '1620',
-                        '1621',
-                        'dewk',
-                    ]
-                    return any(marker in header_text for marker in fluke_markers)
+                probe = probe or FileProbe(filepath)
+                return self._header_has_marker(probe, 15)
 
             elif suffix in ['.xlsx', '.xls']:
-                df = pd.read_excel(filepath, nrows=10, header=None)
-                text = df.astype(str).values.flatten()
-                text_lower = ' '.join(text).lower()
-
-                return 'fluke' in text_lower or 'hydra' in text_lower
+                probe = probe or FileProbe(filepath)
+                # Stop at the first cell carrying a marker; no joined text is built
+                for row in probe.rows(0)[:10]:
+                    for value in row:
+                        if value is None:
+                            continue
+                        text = str(value).lower()
+                        if 'fluke' in text or 'hydra' in text:
+                            return True
+                return False
 
             return False
         except Exception:
@@ -69,32 +68,17 @@ class FlukeParser(BaseParser):
             df, metadata = self._parse_csv(filepath)
 
         # Find time column
-        time_col = None
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(t in col_lower for t in ['time', 'date', 'timestamp', 'scan']):
-                time_col = col
-                break
+        time_col = self._find_column(df.columns, ['time', 'date', 'timestamp', 'scan'])
 
         # Try to parse time
         if time_col:
-            try:
-                df[time_col] = pd.to_datetime(df[time_col])
-            except (ValueError, TypeError):
-                try:
-                    df[time_col] = pd.to_numeric(df[time_col])
-                except (ValueError, TypeError):
-                    pass
+            df = self._parse_time_column(df, time_col)
 
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
         # Parse units from column names
-        units = {}
-        for col in channels:
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
+        _, units = self._extract_units_vectorized(channels)
 
         info = DataInfo(
             filename=path.name,
@@ -113,21 +97,28 @@ class FlukeParser(BaseParser):
         metadata = {}
         header_row = 0
 
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        # Only the first 20 lines are inspected, reusing the bytes detect() read
+        lines = self._header_lines(filepath, 20)
+
+        # The first data line (after line 8) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 9)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
 
-        for i, line in enumerate(lines[:20]):
+        for i, line in enumerate(lines):
             line_lower = line.lower()
 
             # Parse metadata
             if 'fluke' in line_lower or 'hydra' in line_lower:
                 metadata['manufacturer'] = 'Fluke'
-                match = re.search(r'(\d{4}[a-z]?)', line)
+                match = _MODEL_RE.search(line)
                 if match:
                     metadata['model'] = match.group(1)
 
             if 'date' in line_lower:
-                match = re.search(r'(\d{4}[/-]\d{2}[/-]\d{2})', line)
+                match = _DATE_RE.search(line)
                 if match:
                     metadata['acquisition_date'] = match.group(1)
 
@@ -136,23 +127,21 @@ class FlukeParser(BaseParser):
                 header_row = i
                 break
 
-            if i > 8 and re.match(r'^[\d.,-]+', line):
-                header_row = max(0, i - 1)
-                break
-
-        df = pd.read_csv(filepath, skiprows=header_row)
+        df = self._read_csv(filepath, skiprows=header_row)
         return df, metadata
 
     def _parse_excel(self, filepath: str) -> tuple[pd.DataFrame, dict]:
         """Parse Excel format."""
         metadata = {}
 
-        # Read first rows to find header
-        df_raw = pd.read_excel(filepath, header=None, nrows=20)
+        # Single pass: scan the first rows for the header, then keep consuming
+        # the same row iterator for the data instead of re-opening the workbook
+        rows = self._read_excel_rows(filepath)
+        scanned = list(itertools.islice(rows, 20))
 
         header_row = 0
-        for i in range(len(df_raw)):
-            row_text = ' '.join(df_raw.iloc[i].astype(str)).lower()
+        for i, row in enumerate(scanned):
+            row_text = ' '.join(str(v) for v in row if v is not None).lower()
 
             if 'fluke' in row_text or 'hydra' in row_text:
                 metadata['manufacturer'] = 'Fluke'
@@ -161,5 +150,10 @@ class FlukeParser(BaseParser):
                 header_row = i
                 break
 
-        df = pd.read_excel(filepath, header=header_row)
+        if not scanned:
+            return pd.DataFrame(), metadata
+
+        header = scanned[header_row]
+        data_rows = itertools.chain(scanned[header_row + 1:], rows)
+        df = self._rows_to_frame(header, data_rows)
         return df, metadata
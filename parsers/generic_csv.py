@@ -9,10 +9,23 @@ Handles standard CSV files with:
 This is a fallback parser for CSV files that don't match any specific equipment.
 """
 
+from collections import Counter
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from typing import Iterator
+from .base import BaseParser, DataInfo, FileProbe, _read_header_bytes
+
+# Bytes sampled from the start of the file for format detection (grown up
+# to _SNIFF_MAX_BYTES when rows are so wide that 10 lines don't fit)
+_SNIFF_BYTES = 8192
+_SNIFF_MAX_BYTES = 1 << 20
+
+# A field that float() would accept (quotes and whitespace already stripped)
+_NUM_RE = re.compile(
+    rb'[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?|[-+]?(?:nan|inf(?:inity)?)', re.IGNORECASE
+)
 
 
 class GenericCSVParser(BaseParser):
@@ -20,8 +33,10 @@ class GenericCSVParser(BaseParser):
 
     name = "csv"
     description = "Generic parser for CSV data files"
+    supported_suffixes = frozenset({'.csv', '.txt', '.tsv'})
+    priority = 100  # Fallback: tried after every specific parser
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a CSV file (used as fallback)."""
         try:
             path = Path(filepath)
@@ -31,133 +46,183 @@ class GenericCSVParser(BaseParser):
 
     def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
         """Reads generic CSV file with smart detection."""
-        path = Path(filepath)
-        metadata = {}
-
         # Detect delimiter and encoding
         delimiter, encoding, has_header, skip_rows = self._detect_format(filepath)
 
-        # Read data
-        df = pd.read_csv(
+        # Read data (pyarrow engine when available, C engine otherwise)
+        df = self._read_csv(
             filepath,
             delimiter=delimiter,
             encoding=encoding,
             header=0 if has_header else None,
-            skiprows=skip_rows
+            skiprows=skip_rows,
+            memory_map=True
         )
 
+        df, time_col = self._prepare(df, has_header)
+        return df, self._build_info(Path(filepath).name, df, time_col)
+
+    def parse_stream(
+        self, filepath: str, chunksize: int = 1_000_000
+    ) -> Iterator[tuple[pd.DataFrame, DataInfo]]:
+        """
+        Reads generic CSV file in chunks of `chunksize` rows.
+
+        The time column and units are chosen on the first chunk and applied
+        to the following ones; generated row numbers continue across chunks.
+        """
+        delimiter, encoding, has_header, skip_rows = self._detect_format(filepath)
+
+        # chunksize needs the C engine (pyarrow reads the whole file)
+        reader = pd.read_csv(
+            filepath,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=0 if has_header else None,
+            skiprows=skip_rows,
+            memory_map=True,
+            chunksize=chunksize
+        )
+
+        info = None
+        time_col = None
+        offset = 0
+        with reader:
+            for chunk in reader:
+                if info is None:
+                    chunk, time_col = self._prepare(chunk, has_header)
+                    info = self._build_info(Path(filepath).name, chunk, time_col)
+                else:
+                    chunk, _ = self._prepare(chunk, has_header, time_col, offset)
+                offset += len(chunk)
+                yield chunk, info
+
+    def _prepare(
+        self,
+        df: pd.DataFrame,
+        has_header: bool,
+        time_col: str | None = None,
+        offset: int = 0,
+    ) -> tuple[pd.DataFrame, str]:
+        """Names columns and sets up the time column (detected unless given)."""
         # Generate column names if no header
         if not has_header:
             df.columns = [f'Col_{i+1}' for i in range(len(df.columns))]
 
         # Detect time column
-        time_col = self._detect_time_column(df)
-
-        # If no time column, create index
         if time_col is None:
-            # Check if first column could be time/index
-            first_col = df.columns[0]
-            if self._is_monotonic(df[first_col]):
-                time_col = first_col
-            else:
-                df.insert(0, 'Index', range(len(df)))
-                time_col = 'Index'
-
-        # Try to parse time column
-        if time_col and time_col != 'Index':
+            time_col = self._detect_time_column(df)
+
+            # If no time column, create index
+            if time_col is None:
+                # Check if first column could be time/index
+                first_col = df.columns[0]
+                time_col = first_col if self._is_monotonic(df[first_col]) else 'Index'
+
+        if time_col == 'Index':
+            # Row number column; continues across chunks when streaming
+            df.insert(0, 'Index', range(offset, offset + len(df)))
+        else:
+            # Try to parse time column
             df = self._parse_time(df, time_col)
 
+        return df, time_col
+
+    def _build_info(self, filename: str, df: pd.DataFrame, time_col: str) -> DataInfo:
+        """Builds the DataInfo for a prepared frame."""
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
         # Try to extract units from column names
-        units = {}
-        for col in channels:
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
+        _, units = self._extract_units_vectorized(channels)
 
         # Calculate sample rate if time is numeric
         sample_rate = None
         if time_col and df[time_col].dtype in ['float64', 'float32', 'int64', 'int32']:
-            if len(df) > 1:
-                dt = df[time_col].iloc[1] - df[time_col].iloc[0]
-                if dt > 0:
+            t = df[time_col].to_numpy()
+            if t.size > 1:
+                dt = t[1] - t[0]
+                # Only uniformly sampled data gets a rate (checked on the first
+                # samples; the tolerance allows for rounding in exported values)
+                if dt > 0 and np.diff(t[:1024]).std() <= 1e-6 * dt:
                     sample_rate = 1.0 / dt
 
-        info = DataInfo(
-            filename=path.name,
+        return DataInfo(
+            filename=filename,
             equipment='Generic CSV',
             channels=channels,
             time_column=time_col,
             sample_rate=sample_rate,
             units=units,
-            metadata=metadata
+            metadata={}
         )
 
-        return df, info
-
     def _detect_format(self, filepath: str) -> tuple[str, str, bool, int]:
         """Detects CSV format parameters."""
-        # Try different encodings
-        encodings = ['utf-8', 'latin-1', 'cp1252']
+        # One binary read of the file head (shared with detection), split
+        # into lines in C; only the first 10 lines are ever decoded
+        n_bytes = _SNIFF_BYTES
+        blob = _read_header_bytes(filepath, n_bytes)
+        if not blob:
+            # Defaults
+            return ',', 'utf-8', True, 0
+
+        raw_lines = blob.splitlines()
+        while len(blob) == n_bytes and len(raw_lines) <= 10 and n_bytes < _SNIFF_MAX_BYTES:
+            # Very wide rows: read more until 10 complete lines fit
+            n_bytes *= 4
+            with open(filepath, 'rb') as f:
+                blob = f.read(n_bytes)
+            raw_lines = blob.splitlines()
+
+        if len(blob) == n_bytes:
+            # The last line may be cut (possibly inside a UTF-8 sequence)
+            raw_lines = raw_lines[:-1] or raw_lines
+        head = b'\n'.join(raw_lines[:10])
 
-        for encoding in encodings:
-            try:
-                with open(filepath, 'r', encoding=encoding, errors='strict') as f:
-                    lines = [f.readline() for _ in range(10)]
-
-                # Detect delimiter
-                first_data_line = lines[0]
-                delimiters = [',', '\t', ';', '|']
-                delimiter = ','
-
-                max_count = 0
-                for d in delimiters:
-                    count = first_data_line.count(d)
-                    if count > max_count:
-                        max_count = count
-                        delimiter = d
-
-                # Detect if has header (first row contains non-numeric values)
-                has_header = False
-                first_values = first_data_line.split(delimiter)
-                non_numeric = 0
-                for val in first_values:
-                    val = val.strip().strip('"\'')
-                    try:
-                        float(val)
-                    except ValueError:
-                        if val:  # Non-empty non-numeric
-                            non_numeric += 1
-
-                has_header = non_numeric > len(first_values) / 2
-
-                # Detect skip rows (comment lines, empty lines at start)
-                skip_rows = 0
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith('#') or line.startswith('//') or not line:
-                        skip_rows += 1
-                    else:
-                        break
-
-                return delimiter, encoding, has_header, skip_rows
-
-            except (UnicodeDecodeError, UnicodeError):
-                continue
-
-        # Defaults
-        return ',', 'utf-8', True, 0
+        try:
+            text, encoding = head.decode('utf-8'), 'utf-8'
+        except UnicodeDecodeError:
+            # latin-1 maps every byte, so it never fails
+            text, encoding = head.decode('latin-1'), 'latin-1'
+
+        lines = text.split('\n')
+
+        # Detect delimiter (most frequent candidate, ',' on ties or none)
+        first_data_line = lines[0] if lines else ''
+        delimiters = [',', '\t', ';', '|']
+        counts = Counter(first_data_line)
+        delimiter = max(delimiters, key=counts.__getitem__)
+
+        # Detect if has header (first row contains non-numeric values).
+        # Fields are matched as bytes against _NUM_RE instead of float()
+        # with try/except per field, which is slow on wide files.
+        first_values = [
+            val.strip().strip(b'"\'')
+            for val in first_data_line.encode(encoding).split(delimiter.encode())
+        ]
+        non_numeric = sum(1 for val in first_values if val and not _NUM_RE.fullmatch(val))
+
+        has_header = non_numeric > len(first_values) / 2
+
+        # Detect skip rows (comment lines, empty lines at start)
+        skip_rows = 0
+        for line in lines:
+            line = line.strip()
+            if line.startswith('#') or line.startswith('//') or not line:
+                skip_rows += 1
+            else:
+                break
+
+        return delimiter, encoding, has_header, skip_rows
 
     def _detect_time_column(self, df: pd.DataFrame) -> str | None:
         """Detects which column contains time data."""
         time_keywords = ['time', 'date', 'timestamp', 't', 'datetime', 'elapsed', 'seconds', 'ms']
 
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(kw in col_lower for kw in time_keywords):
-                return col
+        time_col = self._find_column(df.columns, time_keywords)
+        if time_col is not None:
+            return time_col
 
         # Check first column content
         if len(df.columns) > 0:
@@ -174,7 +239,16 @@ class GenericCSVParser(BaseParser):
     def _is_monotonic(self, series: pd.Series) -> bool:
         """Checks if series is monotonically increasing (like time/index)."""
         try:
-            numeric = pd.to_numeric(series, errors='coerce')
+            if pd.api.types.is_numeric_dtype(series):
+                # Already numeric: no coerced copy needed
+                numeric = series
+            else:
+                # Reject mostly non-numeric text from a sample before converting it all
+                sample = pd.to_numeric(series.iloc[:1024], errors='coerce')
+                if sample.isna().sum() >= len(sample) * 0.1:
+                    return False
+                numeric = pd.to_numeric(series, errors='coerce')
+
             if numeric.isna().sum() < len(numeric) * 0.1:  # Less than 10% NaN
                 return numeric.is_monotonic_increasing or numeric.is_monotonic_decreasing
         except Exception:
@@ -183,18 +257,11 @@ class GenericCSVParser(BaseParser):
 
     def _parse_time(self, df: pd.DataFrame, time_col: str) -> pd.DataFrame:
         """Attempts to parse time column."""
-        # Try datetime parsing
-        try:
-            df[time_col] = pd.to_datetime(df[time_col])
-            return df
-        except (ValueError, TypeError):
-            pass
+        col = df[time_col]
 
-        # Try numeric conversion
-        try:
-            df[time_col] = pd.to_numeric(df[time_col])
+        # Numeric (seconds, sample number) and datetime columns are kept as read
+        if pd.api.types.is_numeric_dtype(col) or pd.api.types.is_datetime64_any_dtype(col):
             return df
-        except (ValueError, TypeError):
-            pass
 
-        return df
+        # Text: datetime, then numeric, each probed on the first rows
+        return self._parse_time_column(df, time_col)
@@ -15,7 +15,14 @@ Format:
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from .base import BaseParser, DataInfo, FileProbe
+
+# One pass per header line: manufacturer marker, model number and date
+_HEADER_LINE_RE = re.compile(r'(hioki)|(lr\d+|mr\d+)|(\d{4}[/-]\d{2}[/-]\d{2})', re.IGNORECASE)
+_NUMERIC_LINE_RE = re.compile(r'^[\d.,-]+', re.MULTILINE)
+
+# Encodings tried in order for CSV exports
+_CSV_ENCODINGS = ('utf-8', 'shift-jis', 'cp932', 'latin-1')
 
 
 class HiokiParser(BaseParser):
@@ -23,42 +30,36 @@ class HiokiParser(BaseParser):
 
     name = "hioki"
     description = "Parser for Hioki LR/MR series datalogger exports"
+    markers = (
+        'hioki', 'lr8400', 'lr8401', 'lr8402', 'lr8410', 'lr8416', 'mr8875', 'memory hicorder',
+    )
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Hioki file."""
         try:
             path = Path(filepath)
             suffix = path.suffix.lower()
 
             if suffix in ['.csv', '.txt']:
-                # Try multiple encodings (Hioki often uses Shift-JIS)
-                for encoding in ['utf-8', 'shift-jis', 'cp932']:
-                    try:
-                        with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
-                            header_lines = [f.readline() for _ in range(15)]
-                            header_text = ''.join(header_lines).lower()
-
-                            hioki_markers = [
-                                'hioki',
-                                'lr8400',
-                                'lr8401',
-                                'lr8402',
-                                'lr8410',
-                                'lr8416',
-                                'mr8875',
-                                'memory hicorder',
-                            ]
-                            if any(marker in header_text for marker in hioki_markers):
-                                return True
-                    except Exception:
-                        continue
+                # Markers are ASCII, so the shared UTF-8 (errors ignored) decode
+                # also finds them in Shift-JIS files
+                probe = probe or FileProbe(filepath)
+                return self._header_has_marker(probe, 15)
 
             elif suffix in ['.xlsx', '.xls']:
-                df = pd.read_excel(filepath, nrows=10, header=None)
-                text = df.astype(str).values.flatten()
-                text_lower = ' '.join(text).lower()
+                probe = probe or FileProbe(filepath)
+                if not probe.is_excel:
+                    return False
+                excel_markers = ['hioki', 'lr84']
+
+                # .xlsx text cells live in the shared strings part
+                shared = probe.shared_strings
+                if shared:
+                    return any(marker.encode() in shared for marker in excel_markers)
 
-                return 'hioki' in text_lower or 'lr84' in text_lower
+                rows = probe.rows(0)[:10]
+                text_lower = ' '.join(str(v) for row in rows for v in row if v is not None).lower()
+                return any(marker in text_lower for marker in excel_markers)
 
             return False
         except Exception:
@@ -76,32 +77,17 @@ class HiokiParser(BaseParser):
             df, metadata = self._parse_csv(filepath)
 
         # Find time column
-        time_col = None
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(t in col_lower for t in ['time', 'date', '時間', '日時']):
-                time_col = col
-                break
+        time_col = self._find_column(df.columns, ['time', 'date', '時間', '日時'])
 
         # Try to parse time
         if time_col:
-            try:
-                df[time_col] = pd.to_datetime(df[time_col])
-            except (ValueError, TypeError):
-                try:
-                    df[time_col] = pd.to_numeric(df[time_col])
-                except (ValueError, TypeError):
-                    pass
+            df = self._parse_time_column(df, time_col)
 
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
         # Parse units from column names
-        units = {}
-        for col in channels:
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
+        _, units = self._extract_units_vectorized(channels)
 
         # Detect equipment model
         equipment = 'Hioki Datalogger'
@@ -130,46 +116,63 @@ class HiokiParser(BaseParser):
         header_row = 0
         encoding_used = 'utf-8'
 
+        # Only the first 25 lines are inspected; they are read once and each
+        # encoding is tried in memory
+        raw_lines = self._read_head_lines(filepath, 25)
+
         # Try different encodings
-        for encoding in ['utf-8', 'shift-jis', 'cp932', 'latin-1']:
+        for encoding in _CSV_ENCODINGS:
             try:
-                with open(filepath, 'r', encoding=encoding, errors='strict') as f:
-                    lines = f.readlines()
+                lines = [line.decode(encoding) for line in raw_lines]
                 encoding_used = encoding
                 break
             except (UnicodeDecodeError, UnicodeError):
                 continue
         else:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            lines = [line.decode('utf-8', errors='ignore') for line in raw_lines]
 
-        for i, line in enumerate(lines[:25]):
+        # The first data line (after line 10) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 11)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
+
+        for i, line in enumerate(lines):
             line_lower = line.lower()
 
-            # Parse metadata
-            if 'hioki' in line_lower:
-                metadata['manufacturer'] = 'Hioki'
+            # Parse metadata (first model and date match of the line)
+            model = date = None
+            for match in _HEADER_LINE_RE.finditer(line):
+                marker, model_match, date_match = match.groups()
+                if marker:
+                    metadata['manufacturer'] = 'Hioki'
+                elif model_match:
+                    model = model or model_match
+                elif date_match:
+                    date = date or date_match
 
-            if any(m in line_lower for m in ['lr84', 'mr88']):
-                match = re.search(r'(lr\d+|mr\d+)', line_lower)
-                if match:
-                    metadata['model'] = match.group(1).upper()
+            if model and any(m in line_lower for m in ['lr84', 'mr88']):
+                metadata['model'] = model.upper()
 
-            if 'date' in line_lower or '日付' in line:
-                match = re.search(r'(\d{4}[/-]\d{2}[/-]\d{2})', line)
-                if match:
-                    metadata['acquisition_date'] = match.group(1)
+            if date and ('date' in line_lower or '日付' in line):
+                metadata['acquisition_date'] = date
 
             # Find header row
             if 'time' in line_lower or 'ch' in line_lower or '時間' in line:
                 header_row = i
                 break
 
-            if i > 10 and re.match(r'^[\d.,-]+', line):
-                header_row = max(0, i - 1)
+        # The header lines can decode as UTF-8 while a later cell (e.g. a
+        # Japanese comment) cannot: fall back to the next encodings then
+        start = _CSV_ENCODINGS.index(encoding_used)
+        for encoding in _CSV_ENCODINGS[start:]:
+            try:
+                df = pd.read_csv(filepath, skiprows=header_row, encoding=encoding, memory_map=True)
                 break
+            except UnicodeDecodeError:
+                continue
 
-        df = pd.read_csv(filepath, skiprows=header_row, encoding=encoding_used)
         return df, metadata
 
     def _parse_excel(self, filepath: str) -> tuple[pd.DataFrame, dict]:
@@ -178,9 +181,12 @@ class HiokiParser(BaseParser):
 
         df_raw = pd.read_excel(filepath, header=None, nrows=25)
 
+        # Empty cells as '' (astype(str) keeps NaN as a float under pandas 3)
+        cells = df_raw.astype(str).fillna('')
+
         header_row = 0
-        for i in range(len(df_raw)):
-            row_text = ' '.join(df_raw.iloc[i].astype(str)).lower()
+        for i in range(len(cells)):
+            row_text = ' '.join(cells.iloc[i]).lower()
 
             if 'hioki' in row_text:
                 metadata['manufacturer'] = 'Hioki'
@@ -15,7 +15,12 @@ Format:
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from .base import BaseParser, DataInfo, FileProbe
+
+# Header line patterns
+_MODEL_RE = re.compile(r'(\d{4}[a-z]?)')
+_DATE_RE = re.compile(r'(\d{4}[/-]\d{2}[/-]\d{2})')
+_NUMERIC_LINE_RE = re.compile(r'^-?[\d.e+-]+[,\t]', re.MULTILINE)
 
 
 class KeithleyParser(BaseParser):
@@ -23,41 +28,35 @@ class KeithleyParser(BaseParser):
 
     name = "keithley"
     description = "Parser for Keithley SourceMeter and DMM exports"
+    markers = (
+        'keithley', 'tektronix keithley', 'sourcemeter', 'source meter', '2400', '2450',
+        '2460', '2470', 'dmm6500', 'daq6510', '2100', '2110', 'kickstart',
+    )
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Keithley file."""
         try:
             path = Path(filepath)
             suffix = path.suffix.lower()
 
             if suffix in ['.csv', '.txt']:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    header_lines = [f.readline() for _ in range(20)]
-                    header_text = ''.join(header_lines).lower()
-
-                    keithley_markers = [
-                        'keithley',
-                        'tektronix keithley',
-                        'sourcemeter',
-                        'source meter',
-                        '2400',
-                        '2450',
-                        '2460',
-                        '2470',
-                        'dmm6500',
-                        'daq6510',
-                        '2100',
-                        '2110',
-                        'kickstart',
-                    ]
-                    return any(marker in header_text for marker in keithley_markers)
+                probe = probe or FileProbe(filepath)
+                return self._header_has_marker(probe, 20)
 
             elif suffix in ['.xlsx', '.xls']:
-                df = pd.read_excel(filepath, nrows=15, header=None)
-                text = df.astype(str).values.flatten()
-                text_lower = ' '.join(text).lower()
+                probe = probe or FileProbe(filepath)
+                if not probe.is_excel:
+                    return False
+                excel_markers = ['keithley', 'sourcemeter']
+
+                # .xlsx text cells live in the shared strings part
+                shared = probe.shared_strings
+                if shared:
+                    return any(marker.encode() in shared for marker in excel_markers)
 
-                return 'keithley' in text_lower or 'sourcemeter' in text_lower
+                rows = probe.rows(0)[:15]
+                text_lower = ' '.join(str(v) for row in rows for v in row if v is not None).lower()
+                return any(marker in text_lower for marker in excel_markers)
 
             return False
         except Exception:
@@ -75,12 +74,7 @@ class KeithleyParser(BaseParser):
             df, metadata = self._parse_csv(filepath)
 
         # Find time column
-        time_col = None
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(t in col_lower for t in ['time', 'timestamp', 'date', 'reading']):
-                time_col = col
-                break
+        time_col = self._find_column(df.columns, ['time', 'timestamp', 'date', 'reading'])
 
         # If no time column, use index
         if time_col is None:
@@ -89,24 +83,16 @@ class KeithleyParser(BaseParser):
 
         # Try to parse time
         if time_col and time_col != 'Reading':
-            try:
-                df[time_col] = pd.to_datetime(df[time_col])
-            except (ValueError, TypeError):
-                try:
-                    df[time_col] = pd.to_numeric(df[time_col])
-                except (ValueError, TypeError):
-                    pass
+            df = self._parse_time_column(df, time_col)
 
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
         # Parse units (Keithley columns often have units: "Voltage (V)", "Current (A)")
-        units = {}
+        _, extracted = self._extract_units_vectorized(channels)
+        units = dict(extracted.items())
         for col in channels:
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
-            else:
+            if col not in units:
                 # Infer from column name
                 col_lower = str(col).lower()
                 if 'volt' in col_lower or col_lower == 'v':
@@ -146,20 +132,28 @@ class KeithleyParser(BaseParser):
         metadata = {}
         header_row = 0
 
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        # Only the first 30 lines are inspected; don't read the whole file
+        raw_lines = self._read_head_lines(filepath, 30)
+        lines = [line.decode('utf-8', errors='ignore') for line in raw_lines]
+
+        # The first data line (after line 10) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 11)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
 
-        for i, line in enumerate(lines[:30]):
+        for i, line in enumerate(lines):
             line_lower = line.lower()
 
             # Parse metadata
             if 'keithley' in line_lower or 'model' in line_lower:
-                match = re.search(r'(\d{4}[a-z]?)', line)
+                match = _MODEL_RE.search(line)
                 if match:
                     metadata['model'] = match.group(1)
 
             if 'date' in line_lower:
-                match = re.search(r'(\d{4}[/-]\d{2}[/-]\d{2})', line)
+                match = _DATE_RE.search(line)
                 if match:
                     metadata['acquisition_date'] = match.group(1)
 
@@ -173,11 +167,7 @@ class KeithleyParser(BaseParser):
                 header_row = i
                 break
 
-            if i > 10 and re.match(r'^-?[\d.e+-]+[,\t]', line):
-                header_row = max(0, i - 1)
-                break
-
-        df = pd.read_csv(filepath, skiprows=header_row)
+        df = pd.read_csv(filepath, skiprows=header_row, memory_map=True)
         return df, metadata
 
     def _parse_excel(self, filepath: str) -> tuple[pd.DataFrame, dict]:
@@ -186,12 +176,15 @@ class KeithleyParser(BaseParser):
 
         df_raw = pd.read_excel(filepath, header=None, nrows=30)
 
+        # Empty cells as '' (astype(str) keeps NaN as a float under pandas 3)
+        cells = df_raw.astype(str).fillna('')
+
         header_row = 0
-        for i in range(len(df_raw)):
-            row_text = ' '.join(df_raw.iloc[i].astype(str)).lower()
+        for i in range(len(cells)):
+            row_text = ' '.join(cells.iloc[i]).lower()
 
             if 'keithley' in row_text:
-                match = re.search(r'(\d{4}[a-z]?)', row_text)
+                match = _MODEL_RE.search(row_text)
                 if match:
                     metadata['model'] = match.group(1)
 
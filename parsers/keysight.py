@@ -8,11 +8,15 @@ Format:
 - Alternating columns: value and alarm for each channel
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
 from datetime import datetime
-from .base import BaseParser, DataInfo
+from .base import BaseParser, DataInfo, FileProbe
+
+# Leading slot digit of a channel name ("101" -> slot 1)
+_SLOT_RE = re.compile(r'(\d)')
 
 
 class KeysightParser(BaseParser):
@@ -20,18 +24,29 @@ class KeysightParser(BaseParser):
 
     name = "keysight"
     description = "Parser for Keysight 34970A BenchLink Data Logger files"
+    supported_suffixes = frozenset({'.xlsx', '.xlsm', '.xls'})
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Keysight file."""
         try:
-            df = pd.read_excel(filepath, sheet_name=0, header=None, nrows=10)
+            probe = probe or FileProbe(filepath)
+
+            # BenchLink exports are workbooks: check extension and file signature first
+            if not probe.is_excel:
+                return False
+
+            # BenchLink writes its identifiers as text cells, so an .xlsx
+            # without them in the shared strings part is rejected unopened
+            shared = probe.shared_strings
+            if shared and not any(m in shared for m in (b'34970', b'34972', b'instrument:')):
+                return False
 
             # Look for typical Keysight identifiers
-            for i in range(min(6, len(df))):
-                row_values = df.iloc[i].astype(str).str.lower()
-                if any('34970' in str(v) or '34972' in str(v) for v in row_values):
+            for row in probe.rows(0)[:6]:
+                row_values = [str(v).lower() for v in row]
+                if any('34970' in v or '34972' in v for v in row_values):
                     return True
-                if any('instrument:' in str(v) for v in row_values):
+                if any('instrument:' in v for v in row_values):
                     return True
 
             return False
@@ -40,8 +55,12 @@ class KeysightParser(BaseParser):
 
     def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
         """Reads Keysight file."""
-        # Read complete file without header
-        df_raw = pd.read_excel(filepath, sheet_name=0, header=None)
+        # Read complete first sheet without header, through the read-only
+        # row reader (openpyxl, or python-calamine when installed) instead of
+        # a full pd.read_excel workbook load
+        rows = list(self._read_excel_rows(filepath))
+        width = max((len(row) for row in rows), default=0)
+        df_raw = self._rows_to_frame(range(width), rows)
 
         # Extract metadata from header
         metadata = self._parse_header(df_raw)
@@ -52,12 +71,12 @@ class KeysightParser(BaseParser):
         if data_start_row is None:
             raise ValueError("Could not find data start in file")
 
-        # Read data - data_start_row is the header, data starts on next row
-        df = pd.read_excel(
-            filepath,
-            sheet_name=0,
-            header=data_start_row
-        )
+        # data_start_row is the header, data starts on next row. Reuse the
+        # sheet already in memory instead of parsing the workbook again;
+        # infer_objects() restores the column dtypes the mixed sheet lost
+        df = df_raw.iloc[data_start_row + 1:].reset_index(drop=True)
+        df.columns = self._header_names(df_raw.iloc[data_start_row].tolist())
+        df = df.infer_objects()
 
         # Process columns - remove alarm columns
         df, channels, units = self._process_columns(df)
@@ -83,10 +102,19 @@ class KeysightParser(BaseParser):
     def _parse_header(self, df: pd.DataFrame) -> dict:
         """Extracts metadata from header."""
         metadata = {}
+        if df.shape[1] == 0:
+            return metadata
 
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
-            first_col = str(row.iloc[0]).lower() if pd.notna(row.iloc[0]) else ''
+        # Lowercase the first-column labels of the header rows in one call;
+        # a row is only materialized when its label is a known field
+        head = df.iloc[:10]
+        first = head.iloc[:, 0]
+        labels = first.astype(str).str.lower().where(first.notna(), '').tolist()
+
+        for i, first_col in enumerate(labels):
+            if not first_col:
+                continue
+            row = head.iloc[i]
 
             if 'name:' in first_col:
                 metadata['name'] = row.iloc[1] if pd.notna(row.iloc[1]) else None
@@ -117,53 +145,44 @@ class KeysightParser(BaseParser):
 
     def _find_data_start(self, df: pd.DataFrame) -> int | None:
         """Finds the row where data starts."""
-        for i in range(len(df)):
-            first_val = str(df.iloc[i, 0]).lower() if pd.notna(df.iloc[i, 0]) else ''
-            if first_val == 'scan':
-                return i
-        return None
+        if df.shape[1] == 0:
+            return None
 
-    def _process_columns(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list, dict]:
-        """Removes alarm columns and extracts units."""
-        columns_to_keep = []
-        channels = []
-        units = {}
+        # Vectorized search for the "Scan" header in the first column
+        first = df.iloc[:, 0]
+        is_scan = (first.astype(str).str.lower() == 'scan') & first.notna()
+        if not is_scan.any():
+            return None
+        return int(is_scan.to_numpy().argmax())
 
-        for col in df.columns:
-            col_str = str(col).lower()
-
-            # Skip alarm columns
-            if 'alarm' in col_str:
-                continue
-
-            columns_to_keep.append(col)
+    def _process_columns(self, df: pd.DataFrame) -> tuple[pd.DataFrame, list, pd.Series]:
+        """Removes alarm columns and extracts units."""
+        # Skip alarm columns (one boolean mask instead of a per-column loop)
+        is_alarm = df.columns.astype(str).str.contains('alarm', case=False, regex=False)
+        df = df.loc[:, ~is_alarm]
 
-            # Extract unit from column name
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
-                channels.append(name)
-            elif col not in ['Scan', 'Time']:
-                channels.append(str(col))
+        # Extract units from column names; channels are named without the unit,
+        # and Scan/Time are only channels if they carry a unit
+        names, units = self._extract_units_vectorized(df.columns)
+        is_channel = df.columns.isin(units.index) | ~df.columns.isin(['Scan', 'Time'])
+        channels = np.asarray(names, dtype=object)[is_channel].tolist()
 
-        return df[columns_to_keep], channels, units
+        return df, channels, units
 
     def _find_time_column(self, df: pd.DataFrame) -> str | None:
         """Finds the time column."""
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if col_lower == 'time' or 'time' in col_lower:
-                return col
-        return None
+        return self._find_column(df.columns, ['time'])
 
     def _convert_time(self, df: pd.DataFrame, time_col: str) -> pd.DataFrame:
         """Converts time column to datetime."""
         try:
             # Typical format: "25/11/2025 17:37:51:442"
-            df[time_col] = pd.to_datetime(df[time_col], format='%d/%m/%Y %H:%M:%S:%f')
+            df[time_col] = pd.to_datetime(
+                df[time_col], format='%d/%m/%Y %H:%M:%S:%f', exact=True, cache=True
+            )
         except (ValueError, TypeError):
             try:
-                df[time_col] = pd.to_datetime(df[time_col])
+                df[time_col] = self._to_datetime(df[time_col])
             except (ValueError, TypeError):
                 pass  # Keep as is
         return df
@@ -182,7 +201,7 @@ class KeysightParser(BaseParser):
 
             # Extract channel number
             name, _ = self._extract_unit(str(col))
-            match = re.match(r'(\d)', name)
+            match = _SLOT_RE.match(name)
             if match:
                 slot = int(match.group(1))
                 if slot not in slots:
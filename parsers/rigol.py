@@ -12,10 +12,18 @@ Format:
 - Time column and channel data
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from typing import Iterator
+from .base import BaseParser, DataInfo, FileProbe
+
+# Header line and column name patterns
+_MODEL_RE = re.compile(r'(ds\d+|mso\d+|dho\d+)')
+_NUMBER_RE = re.compile(r'([\d.e+-]+)')
+_NUMERIC_LINE_RE = re.compile(r'^-?[\d.e+-]+[,\t]', re.MULTILINE)
+_CHANNEL_COL_RE = re.compile(r'^(ch\d+)\s*\(', re.IGNORECASE)
 
 
 class RigolParser(BaseParser):
@@ -23,44 +31,69 @@ class RigolParser(BaseParser):
 
     name = "rigol"
     description = "Parser for Rigol oscilloscope CSV exports"
+    supported_suffixes = frozenset({'.csv', '.txt'})
+    markers = ('rigol', 'ds1', 'ds2', 'mso5', 'dho', 'dg1', 'x(s)', 'ch1(v)')
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Rigol file."""
         try:
             path = Path(filepath)
             if path.suffix.lower() not in ['.csv', '.txt']:
                 return False
 
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                header_lines = [f.readline() for _ in range(15)]
-                header_text = ''.join(header_lines).lower()
-
-                rigol_markers = [
-                    'rigol',
-                    'ds1',
-                    'ds2',
-                    'mso5',
-                    'dho',
-                    'dg1',
-                    'x(s)',
-                    'ch1(v)',
-                ]
-                return any(marker in header_text for marker in rigol_markers)
+            probe = probe or FileProbe(filepath)
+            return self._header_has_marker(probe, 15)
 
         except Exception:
             return False
 
     def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
         """Reads Rigol CSV file."""
-        path = Path(filepath)
+        header_row, metadata = self._read_header(filepath)
+
+        # Read data (pyarrow engine when available, C engine otherwise)
+        df = self._read_csv(filepath, skiprows=header_row)
+        self._clean_columns(df)
+
+        return df, self._build_info(Path(filepath).name, df, metadata)
+
+    def parse_stream(
+        self, filepath: str, chunksize: int = 1_000_000
+    ) -> Iterator[tuple[pd.DataFrame, DataInfo]]:
+        """
+        Reads Rigol CSV file in chunks of `chunksize` rows.
+
+        Deep-memory captures never have to fit in memory at once; the
+        DataInfo is built from the first chunk.
+        """
+        header_row, metadata = self._read_header(filepath)
+
+        info = None
+        # chunksize needs the C engine (pyarrow reads the whole file)
+        with pd.read_csv(filepath, skiprows=header_row, chunksize=chunksize) as reader:
+            for chunk in reader:
+                self._clean_columns(chunk)
+                if info is None:
+                    info = self._build_info(Path(filepath).name, chunk, metadata)
+                yield chunk, info
+
+    def _read_header(self, filepath: str) -> tuple[int, dict]:
+        """Scans the header lines; returns (header row, metadata)."""
         metadata = {}
 
-        # Read header
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        # Header lines, reusing the bytes detect() already read
+        lines = self._header_lines(filepath, 20)
 
         header_row = 0
-        for i, line in enumerate(lines[:20]):
+
+        # The first data line (after line 5) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 6)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
+
+        for i, line in enumerate(lines):
             line_lower = line.lower()
 
             # Parse metadata
@@ -68,12 +101,12 @@ class RigolParser(BaseParser):
                 metadata['manufacturer'] = 'Rigol'
 
             if any(m in line_lower for m in ['ds1', 'ds2', 'mso', 'dho']):
-                match = re.search(r'(ds\d+|mso\d+|dho\d+)', line_lower)
+                match = _MODEL_RE.search(line_lower)
                 if match:
                     metadata['model'] = match.group(1).upper()
 
             if 'sample rate' in line_lower:
-                match = re.search(r'([\d.e+-]+)', line)
+                match = _NUMBER_RE.search(line)
                 if match:
                     metadata['sample_rate'] = float(match.group(1))
 
@@ -82,26 +115,18 @@ class RigolParser(BaseParser):
                 header_row = i
                 break
 
-            if i > 5 and re.match(r'^-?[\d.e+-]+[,\t]', line):
-                header_row = max(0, i - 1)
-                break
+        return header_row, metadata
 
-        # Read data
-        df = pd.read_csv(filepath, skiprows=header_row)
-
-        # Clean column names
-        new_columns = []
-        for col in df.columns:
-            col_str = str(col).strip()
-            # Rigol format: "X(S)" -> "Time", "CH1(V)" -> "CH1"
-            if col_str.lower().startswith('x('):
-                new_columns.append('Time')
-            elif match := re.match(r'(ch\d+)\s*\(', col_str, re.IGNORECASE):
-                new_columns.append(match.group(1).upper())
-            else:
-                new_columns.append(col_str)
-        df.columns = new_columns
+    def _clean_columns(self, df: pd.DataFrame) -> None:
+        """Renames the columns in place: "X(S)" -> "Time", "CH1(V)" -> "CH1"."""
+        # All at once with the .str accessor
+        cols = df.columns.astype(str).str.strip()
+        channel = cols.str.extract(_CHANNEL_COL_RE, expand=False).str.upper()
+        is_time = cols.str.lower().str.startswith('x(')
+        df.columns = np.where(is_time, 'Time', channel.where(channel.notna(), cols))
 
+    def _build_info(self, filename: str, df: pd.DataFrame, metadata: dict) -> DataInfo:
+        """Builds the DataInfo for a frame with cleaned columns."""
         # Find time column
         time_col = 'Time' if 'Time' in df.columns else None
 
@@ -110,16 +135,18 @@ class RigolParser(BaseParser):
 
         # Calculate sample rate from data if not in metadata
         sample_rate = metadata.get('sample_rate')
-        if sample_rate is None and time_col and len(df) > 1:
-            dt = df[time_col].iloc[1] - df[time_col].iloc[0]
-            if dt > 0:
-                sample_rate = 1.0 / dt
+        if sample_rate is None and time_col:
+            t = df[time_col].to_numpy()
+            if t.dtype.kind in 'fiu' and t.size > 1:
+                dt = float(t[1]) - float(t[0])
+                if dt > 0:
+                    sample_rate = 1.0 / dt
 
         # Units (typically V for oscilloscope channels)
         units = {ch: 'V' for ch in channels if ch.upper().startswith('CH')}
 
-        info = DataInfo(
-            filename=path.name,
+        return DataInfo(
+            filename=filename,
             equipment='Rigol Oscilloscope',
             channels=channels,
             time_column=time_col,
@@ -127,5 +154,3 @@ class RigolParser(BaseParser):
             units=units,
             metadata=metadata
         )
-
-        return df, info
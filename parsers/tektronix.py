@@ -12,10 +12,18 @@ Format:
 - Optional math and reference channels
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from typing import Iterator, Sequence
+from .base import BaseParser, DataInfo, FileProbe
+
+# Header line and column name patterns
+_INT_RE = re.compile(r'(\d+)')
+_NUMBER_RE = re.compile(r'([\d.e+-]+)')
+_NUMERIC_LINE_RE = re.compile(r'^-?[\d.e+-]+[,\t]', re.MULTILINE)
+_CHANNEL_COL_RE = re.compile(r'^ch(\d+)$', re.IGNORECASE)
 
 
 class TektronixParser(BaseParser):
@@ -23,54 +31,102 @@ class TektronixParser(BaseParser):
 
     name = "tektronix"
     description = "Parser for Tektronix oscilloscope CSV exports"
+    supported_suffixes = frozenset({'.csv', '.txt'})
+    markers = (
+        'tektronix', 'tds', 'mso', 'dpo', 'mdo', 'record length', 'sample interval',
+        'trigger point',
+    )
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Tektronix file."""
         try:
             path = Path(filepath)
             if path.suffix.lower() not in ['.csv', '.txt']:
                 return False
 
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                header_lines = [f.readline() for _ in range(10)]
-                header_text = ''.join(header_lines).lower()
-
-                tektronix_markers = [
-                    'tektronix',
-                    'tds',
-                    'mso',
-                    'dpo',
-                    'mdo',
-                    'record length',
-                    'sample interval',
-                    'trigger point',
-                ]
-                return any(marker in header_text for marker in tektronix_markers)
+            probe = probe or FileProbe(filepath)
+            return self._header_has_marker(probe, 10)
 
         except Exception:
             return False
 
-    def parse(self, filepath: str) -> tuple[pd.DataFrame, DataInfo]:
-        """Reads Tektronix CSV file."""
-        path = Path(filepath)
+    def parse(
+        self, filepath: str, channels: Sequence[str] | None = None
+    ) -> tuple[pd.DataFrame, DataInfo]:
+        """
+        Reads Tektronix CSV file.
+
+        Args:
+            filepath: Path to the file
+            channels: Channels to read, by standardized name (e.g. ['CH1', 'CH2']);
+                      the time column is always kept. Other math/reference
+                      columns are skipped by the CSV reader. Default: all
+        """
+        header_row, metadata = self._read_header(filepath)
+        usecols = self._usecols(filepath, header_row, channels)
+
+        # Read data (pyarrow engine when available, C engine otherwise)
+        df = self._read_csv(filepath, skiprows=header_row, usecols=usecols)
+        time_col = self._prepare(df, metadata)
+
+        return df, self._build_info(Path(filepath).name, df, time_col, metadata)
+
+    def parse_stream(
+        self,
+        filepath: str,
+        chunksize: int = 1_000_000,
+        channels: Sequence[str] | None = None,
+    ) -> Iterator[tuple[pd.DataFrame, DataInfo]]:
+        """
+        Reads Tektronix CSV file in chunks of `chunksize` rows.
+
+        Deep-memory captures never have to fit in memory at once; the
+        DataInfo is built from the first chunk, and a time axis generated
+        from the sample interval continues across chunks. `channels` selects
+        columns as in parse().
+        """
+        header_row, metadata = self._read_header(filepath)
+        usecols = self._usecols(filepath, header_row, channels)
+
+        info = None
+        offset = 0
+        # chunksize needs the C engine (pyarrow reads the whole file)
+        reader = pd.read_csv(filepath, skiprows=header_row, usecols=usecols, chunksize=chunksize)
+        with reader:
+            for chunk in reader:
+                time_col = self._prepare(chunk, metadata, offset)
+                if info is None:
+                    info = self._build_info(Path(filepath).name, chunk, time_col, metadata)
+                offset += len(chunk)
+                yield chunk, info
+
+    def _read_header(self, filepath: str) -> tuple[int, dict]:
+        """Scans the header lines; returns (header row, metadata)."""
         metadata = {}
 
-        # Read header to extract metadata
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        # Header lines to extract metadata, reusing the bytes detect() already read
+        lines = self._header_lines(filepath, 20)
 
         header_row = 0
-        for i, line in enumerate(lines[:20]):
+
+        # The first data line (after line 5) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 6)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
+
+        for i, line in enumerate(lines):
             line_lower = line.lower()
 
             # Parse metadata
             if 'record length' in line_lower:
-                match = re.search(r'(\d+)', line)
+                match = _INT_RE.search(line)
                 if match:
                     metadata['record_length'] = int(match.group(1))
 
             if 'sample interval' in line_lower:
-                match = re.search(r'([\d.e+-]+)', line)
+                match = _NUMBER_RE.search(line)
                 if match:
                     metadata['sample_interval'] = float(match.group(1))
 
@@ -82,31 +138,57 @@ class TektronixParser(BaseParser):
                 header_row = i
                 break
 
-            # If we find numeric data, header is previous row
-            if i > 5 and re.match(r'^-?[\d.e+-]+[,\t]', line):
-                header_row = max(0, i - 1)
-                break
+        return header_row, metadata
+
+    def _usecols(
+        self, filepath: str, header_row: int, channels: Sequence[str] | None
+    ) -> list | None:
+        """
+        Raw column names to read for the requested channels (None: all).
+
+        Only the header line is parsed to learn the available columns.
+        """
+        if channels is None:
+            return None
+
+        raw = pd.read_csv(filepath, skiprows=header_row, nrows=0).columns
+        names = self._standard_names(raw)
+        lower = names.str.lower()
+        keep = names.isin(list(channels)) | lower.str.contains('time') | (lower == 't')
 
-        # Read data
-        df = pd.read_csv(filepath, skiprows=header_row)
+        missing = set(channels) - set(names)
+        if missing:
+            raise ValueError(f"Channels not found: {sorted(missing)}. Available: {list(names)}")
+        return list(raw[keep])
 
-        # Standardize column names
-        df.columns = [self._clean_column_name(c) for c in df.columns]
+    def _standard_names(self, cols: pd.Index) -> pd.Index:
+        """Standardized column names ("ch1" -> "CH1"), in one pass with the .str accessor."""
+        return cols.astype(str).str.strip().str.replace(_CHANNEL_COL_RE, r'CH\1', regex=True)
+
+    def _prepare(self, df: pd.DataFrame, metadata: dict, offset: int = 0) -> str | None:
+        """
+        Standardizes the columns in place and returns the time column.
+
+        Without a time column, one is generated from the sample interval,
+        starting at sample `offset`.
+        """
+        df.columns = self._standard_names(df.columns)
 
         # Find time column
-        time_col = None
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if 'time' in col_lower or col_lower == 't':
-                time_col = col
-                break
+        time_col = self._find_column(df.columns, ['time'], exact=['t'])
 
         # If no time column, create from sample interval
         if time_col is None and 'sample_interval' in metadata:
             dt = metadata['sample_interval']
-            df.insert(0, 'Time', [i * dt for i in range(len(df))])
+            df.insert(0, 'Time', np.arange(offset, offset + len(df), dtype=np.float64) * dt)
             time_col = 'Time'
 
+        return time_col
+
+    def _build_info(
+        self, filename: str, df: pd.DataFrame, time_col: str | None, metadata: dict
+    ) -> DataInfo:
+        """Builds the DataInfo for a prepared frame."""
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
@@ -121,8 +203,8 @@ class TektronixParser(BaseParser):
             if 'ch' in col.lower() or 'math' in col.lower():
                 units[col] = 'V'
 
-        info = DataInfo(
-            filename=path.name,
+        return DataInfo(
+            filename=filename,
             equipment='Tektronix Oscilloscope',
             channels=channels,
             time_column=time_col,
@@ -130,12 +212,3 @@ class TektronixParser(BaseParser):
             units=units,
             metadata=metadata
         )
-
-        return df, info
-
-    def _clean_column_name(self, name: str) -> str:
-        """Clean column name."""
-        name = str(name).strip()
-        # Standardize channel names
-        name = re.sub(r'^ch(\d+)$', r'CH\1', name, flags=re.IGNORECASE)
-        return name
@@ -13,10 +13,24 @@ Format varies by product but typically:
 - Units in header or column names
 """
 
+import numpy as np
 import pandas as pd
 import re
 from pathlib import Path
-from .base import BaseParser, DataInfo
+from typing import Iterator
+from .base import BaseParser, DataInfo, FileProbe
+
+# Header line patterns
+_DATE_RE = re.compile(r'(\d{4}[/-]\d{2}[/-]\d{2})')
+_SAMPLE_RATE_RE = re.compile(r'([\d.]+)\s*(hz|khz|mhz|s|ms|us)')
+_NUMERIC_LINE_RE = re.compile(r'^-?[\d.e+-]+[,\t]', re.MULTILINE)
+
+# Markers of a Yokogawa workbook (text cells and raw shared strings)
+_EXCEL_MARKER_RE = re.compile('yokogawa|dl850|wt')
+_EXCEL_MARKER_BYTES_RE = re.compile(b'yokogawa|dl850|wt')
+
+# Encodings tried in order for CSV exports
+_CSV_ENCODINGS = ('utf-8', 'shift-jis', 'cp1252', 'latin-1')
 
 
 class YokogawaParser(BaseParser):
@@ -24,42 +38,37 @@ class YokogawaParser(BaseParser):
 
     name = "yokogawa"
     description = "Parser for Yokogawa DL/SL/WT/MW series exports"
+    markers = (
+        'yokogawa', 'dl850', 'dl350', 'dl750', 'sl1000', 'wt300', 'wt500', 'wt1800', 'wt3000',
+        'wt5000', 'mw100', 'mw200', 'scopecorder', 'dlm',
+    )
 
-    def detect(self, filepath: str) -> bool:
+    def detect(self, filepath: str, probe: FileProbe | None = None) -> bool:
         """Detects if this is a Yokogawa file."""
         try:
             path = Path(filepath)
             suffix = path.suffix.lower()
 
             if suffix in ['.csv', '.txt']:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    header_lines = [f.readline() for _ in range(25)]
-                    header_text = ''.join(header_lines).lower()
-
-                    yokogawa_markers = [
-                        'yokogawa',
-                        'dl850',
-                        'dl350',
-                        'dl750',
-                        'sl1000',
-                        'wt300',
-                        'wt500',
-                        'wt1800',
-                        'wt3000',
-                        'wt5000',
-                        'mw100',
-                        'mw200',
-                        'scopecorder',
-                        'dlm',
-                    ]
-                    return any(marker in header_text for marker in yokogawa_markers)
+                probe = probe or FileProbe(filepath)
+                return self._header_has_marker(probe, 25)
 
             elif suffix in ['.xlsx', '.xls']:
-                df = pd.read_excel(filepath, nrows=15, header=None)
-                text = df.astype(str).values.flatten()
-                text_lower = ' '.join(text).lower()
-
-                return 'yokogawa' in text_lower or 'dl850' in text_lower or 'wt' in text_lower
+                probe = probe or FileProbe(filepath)
+                # Check the file signature before opening anything as a workbook
+                if not probe.is_excel:
+                    return False
+                # .xlsx text cells live in the shared strings part
+                shared = probe.shared_strings
+                if shared:
+                    return _EXCEL_MARKER_BYTES_RE.search(shared) is not None
+
+                # Only text cells can hold a marker; stop at the first one that does
+                for row in probe.rows(0)[:15]:
+                    for value in row:
+                        if isinstance(value, str) and _EXCEL_MARKER_RE.search(value.lower()):
+                            return True
+                return False
 
             return False
         except Exception:
@@ -83,28 +92,71 @@ class YokogawaParser(BaseParser):
         if time_col:
             df = self._parse_time(df, time_col)
 
+        return df, self._build_info(path.name, df, time_col, metadata)
+
+    def parse_stream(
+        self, filepath: str, chunksize: int = 1_000_000
+    ) -> Iterator[tuple[pd.DataFrame, DataInfo]]:
+        """
+        Reads Yokogawa CSV file in chunks of `chunksize` rows.
+
+        The encoding is the first one that reads the first chunk; the time
+        column and DataInfo are taken from that chunk. Excel files are parsed
+        whole and sliced.
+        """
+        if Path(filepath).suffix.lower() in ['.xlsx', '.xls']:
+            yield from super().parse_stream(filepath, chunksize)
+            return
+
+        for encoding in _CSV_ENCODINGS:
+            metadata = {}
+            reader = None
+            try:
+                header_row = self._read_csv_header(filepath, encoding, metadata)
+                # chunksize needs the C engine (pyarrow reads the whole file)
+                reader = pd.read_csv(
+                    filepath, skiprows=header_row, encoding=encoding, chunksize=chunksize
+                )
+                first = reader.get_chunk()
+            except Exception:
+                if reader is not None:
+                    reader.close()
+                continue
+
+            with reader:
+                time_col = self._find_time_column(first)
+                if time_col:
+                    first = self._parse_time(first, time_col)
+                info = self._build_info(Path(filepath).name, first, time_col, metadata)
+                yield first, info
+
+                for chunk in reader:
+                    if time_col:
+                        chunk = self._parse_time(chunk, time_col)
+                    yield chunk, info
+            return
+
+        # No encoding worked: read with the defaults, as parse() does
+        yield from super().parse_stream(filepath, chunksize)
+
+    def _build_info(
+        self, filename: str, df: pd.DataFrame, time_col: str | None, metadata: dict
+    ) -> DataInfo:
+        """Builds the DataInfo for a frame with a parsed time column."""
         # Extract channels
         channels = [c for c in df.columns if c != time_col]
 
-        # Parse units
-        units = {}
-        for col in channels:
-            name, unit = self._extract_unit(str(col))
-            if unit:
-                units[col] = unit
-            # Yokogawa format: "CH1[V]" or "P1[W]"
-            match = re.search(r'\[([^\]]+)\]', str(col))
-            if match:
-                units[col] = match.group(1)
+        # Parse units: Yokogawa "CH1[V]" / "P1[W]" and "CH1 (V)", in one pass
+        _, units = self._extract_units_vectorized(channels)
 
         # Calculate sample rate
         sample_rate = metadata.get('sample_rate')
         if sample_rate is None and time_col:
-            if df[time_col].dtype in ['float64', 'float32', 'int64', 'int32']:
-                if len(df) > 1:
-                    dt = df[time_col].iloc[1] - df[time_col].iloc[0]
-                    if dt > 0:
-                        sample_rate = 1.0 / dt
+            t = df[time_col].to_numpy()
+            if t.dtype.kind in 'fiu' and t.size > 1:
+                dt = float(t[1]) - float(t[0])
+                if dt > 0:
+                    sample_rate = 1.0 / dt
 
         # Detect equipment type
         equipment = 'Yokogawa'
@@ -119,8 +171,8 @@ class YokogawaParser(BaseParser):
             elif 'MW' in model:
                 equipment = 'Yokogawa MW Data Acquisition'
 
-        info = DataInfo(
-            filename=path.name,
+        return DataInfo(
+            filename=filename,
             equipment=equipment,
             acquisition_date=metadata.get('acquisition_date'),
             channels=channels,
@@ -130,67 +182,73 @@ class YokogawaParser(BaseParser):
             metadata=metadata
         )
 
-        return df, info
-
     def _parse_csv(self, filepath: str) -> tuple[pd.DataFrame, dict]:
         """Parse CSV format."""
         metadata = {}
-        header_row = 0
-
-        encodings = ['utf-8', 'shift-jis', 'cp1252', 'latin-1']
 
-        for encoding in encodings:
+        for encoding in _CSV_ENCODINGS:
             try:
-                with open(filepath, 'r', encoding=encoding, errors='ignore') as f:
-                    lines = f.readlines()
-
-                for i, line in enumerate(lines[:30]):
-                    line_lower = line.lower()
-
-                    # Parse metadata
-                    if 'model' in line_lower or 'yokogawa' in line_lower:
-                        metadata['model'] = line.strip()
-
-                    if 'date' in line_lower:
-                        match = re.search(r'(\d{4}[/-]\d{2}[/-]\d{2})', line)
-                        if match:
-                            metadata['acquisition_date'] = match.group(1)
-
-                    if 'sample' in line_lower and 'rate' in line_lower:
-                        match = re.search(r'([\d.]+)\s*(hz|khz|mhz|s|ms|us)', line_lower)
-                        if match:
-                            value = float(match.group(1))
-                            unit = match.group(2)
-                            if unit == 'khz':
-                                value *= 1000
-                            elif unit == 'mhz':
-                                value *= 1000000
-                            elif unit == 's':
-                                value = 1.0 / value
-                            elif unit == 'ms':
-                                value = 1000.0 / value
-                            elif unit == 'us':
-                                value = 1000000.0 / value
-                            metadata['sample_rate'] = value
-
-                    # Find header row
-                    if 'time' in line_lower or 'ch1' in line_lower or 'ch 1' in line_lower:
-                        header_row = i
-                        break
-
-                    if i > 10 and re.match(r'^-?[\d.e+-]+[,\t]', line):
-                        header_row = max(0, i - 1)
-                        break
-
-                df = pd.read_csv(filepath, skiprows=header_row, encoding=encoding)
+                header_row = self._read_csv_header(filepath, encoding, metadata)
+                df = self._read_csv(filepath, skiprows=header_row, encoding=encoding)
                 return df, metadata
 
             except Exception:
                 continue
 
-        df = pd.read_csv(filepath)
+        df = self._read_csv(filepath)
         return df, metadata
 
+    def _read_csv_header(self, filepath: str, encoding: str, metadata: dict) -> int:
+        """Scans the header lines decoded with `encoding`; returns the header row."""
+        header_row = 0
+
+        # Only the header lines are decoded per encoding, from the
+        # bytes detect() already read
+        lines = self._header_lines(filepath, 30, encoding)
+
+        # The first data line (after line 10) ends the header scan; it is found
+        # with one regex search over the lines instead of a match per line
+        data_row = self._first_match_line(lines, _NUMERIC_LINE_RE, 11)
+        if data_row is not None:
+            header_row = max(0, data_row - 1)
+            lines = lines[:data_row + 1]
+
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+
+            # Parse metadata
+            if 'model' in line_lower or 'yokogawa' in line_lower:
+                metadata['model'] = line.strip()
+
+            if 'date' in line_lower:
+                match = _DATE_RE.search(line)
+                if match:
+                    metadata['acquisition_date'] = match.group(1)
+
+            if 'sample' in line_lower and 'rate' in line_lower:
+                match = _SAMPLE_RATE_RE.search(line_lower)
+                if match:
+                    value = float(match.group(1))
+                    unit = match.group(2)
+                    if unit == 'khz':
+                        value *= 1000
+                    elif unit == 'mhz':
+                        value *= 1000000
+                    elif unit == 's':
+                        value = 1.0 / value
+                    elif unit == 'ms':
+                        value = 1000.0 / value
+                    elif unit == 'us':
+                        value = 1000000.0 / value
+                    metadata['sample_rate'] = value
+
+            # Find header row
+            if 'time' in line_lower or 'ch1' in line_lower or 'ch 1' in line_lower:
+                header_row = i
+                break
+
+        return header_row
+
     def _parse_excel(self, filepath: str) -> tuple[pd.DataFrame, dict]:
         """Parse Excel format."""
         metadata = {}
@@ -198,25 +256,30 @@ class YokogawaParser(BaseParser):
         df_raw = pd.read_excel(filepath, header=None, nrows=30)
 
         header_row = 0
-        for i in range(len(df_raw)):
-            row_text = ' '.join(df_raw.iloc[i].astype(str)).lower()
-
-            if 'yokogawa' in row_text or any(m in row_text for m in ['dl850', 'wt', 'mw']):
-                metadata['model'] = row_text
-
-            if 'time' in row_text or 'ch1' in row_text:
-                header_row = i
-                break
+        if df_raw.shape[1]:
+            # Text of every scanned row at once (empty cells as '')
+            cells = df_raw.astype(str).fillna('')
+            row_text = cells.iloc[:, 0].str.cat(cells.iloc[:, 1:], sep=' ').str.lower()
+
+            # Header row: first row mentioning time or ch1
+            is_header = row_text.str.contains('time|ch1').to_numpy()
+            if is_header.any():
+                header_row = int(is_header.argmax())
+                row_text = row_text.iloc[:header_row + 1]
+
+            # Model: last matching row up to the header
+            is_model = row_text.str.contains('yokogawa|dl850|wt|mw').to_numpy()
+            if is_model.any():
+                metadata['model'] = row_text.iloc[np.flatnonzero(is_model)[-1]]
 
         df = pd.read_excel(filepath, header=header_row)
         return df, metadata
 
     def _find_time_column(self, df: pd.DataFrame) -> str | None:
         """Find time column."""
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if any(t in col_lower for t in ['time', 'date', 't[s]', 't[ms]', 'elapsed']):
-                return col
+        time_col = self._find_column(df.columns, ['time', 'date', 't[s]', 't[ms]', 'elapsed'])
+        if time_col is not None:
+            return time_col
 
         # Check first column
         if len(df.columns) > 0:
@@ -2,12 +2,70 @@
 Plotter - Simplified matplotlib wrapper for equipment data visualization.
 """
 
+import re
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 from typing import Sequence
 from .loader import DataLoader
 
+# Channel number in column names: "Voltage_3" and Keysight's "101 (VDC)"
+_SUFFIX_NUMBER_RE = re.compile(r'_(\d+)')
+_LEADING_NUMBER_RE = re.compile(r'(\d+)')
+
+# Lines with more points are rasterized in vector output (PDF, SVG, EPS)
+_RASTERIZE_MIN_POINTS = 100_000
+
+
+def _bucket_extrema(buckets: np.ndarray, starts: np.ndarray) -> list:
+    """
+    Sample positions of the minimum and maximum of each bucket (row).
+
+    NaN samples (logger dropouts) are skipped so they cannot hide a
+    bucket's real envelope, and the first NaN of a bucket is kept as
+    well, so the gap still shows in the drawn line. An all-NaN bucket
+    yields its first position.
+    """
+    if np.issubdtype(buckets.dtype, np.floating):
+        nan_mask = np.isnan(buckets)
+        if nan_mask.any():
+            has_nan = nan_mask.any(axis=1)
+            return [
+                np.where(nan_mask, np.inf, buckets).argmin(axis=1) + starts,
+                np.where(nan_mask, -np.inf, buckets).argmax(axis=1) + starts,
+                nan_mask[has_nan].argmax(axis=1) + starts[has_nan],
+            ]
+    return [buckets.argmin(axis=1) + starts, buckets.argmax(axis=1) + starts]
+
+
+def _minmax_decimate(x: np.ndarray, y: np.ndarray, max_points: int | None) -> tuple:
+    """
+    Reduces a trace to about `max_points` samples for drawing.
+
+    The samples are split into max_points // 2 equal buckets and only the
+    minimum and maximum of each are kept, in their original order, so peaks
+    and the signal envelope look the same as with every point drawn.
+    Non-numeric traces and traces within the budget are returned unchanged.
+    """
+    n = len(y)
+    if max_points is None or n <= max_points:
+        return x, y
+    if not (np.issubdtype(y.dtype, np.number) or y.dtype == np.bool_):
+        return x, y
+
+    stride = -(-n // max(max_points // 2, 1))
+    n_full = n // stride
+    buckets = y[:n_full * stride].reshape(n_full, stride)
+    keep = _bucket_extrema(buckets, np.arange(n_full) * stride)
+
+    # Last, partial bucket
+    tail_start = n_full * stride
+    if tail_start < n:
+        keep += _bucket_extrema(y[tail_start:].reshape(1, -1), np.array([tail_start]))
+
+    idx = np.unique(np.concatenate(keep))
+    return x[idx], y[idx]
+
 
 class Plotter:
     """
@@ -41,6 +99,8 @@ class Plotter:
         self.loader = loader
         self.figsize = figsize
         self._style_applied = False
+        # column -> simplified label
+        self._label_cache = {}
 
     def apply_style(self, style: str = 'seaborn-v0_8-whitegrid'):
         """Applies a matplotlib style."""
@@ -60,6 +120,7 @@ class Plotter:
         legend: bool = True,
         grid: bool = True,
         figsize: tuple | None = None,
+        max_points: int | None = 10_000,
         **kwargs
     ) -> tuple[plt.Figure, plt.Axes]:
         """
@@ -74,6 +135,8 @@ class Plotter:
             legend: Show legend
             grid: Show grid
             figsize: Figure size
+            max_points: Longer traces are min/max decimated to about this many
+                        points before drawing; None draws every point
             **kwargs: Additional arguments for plt.plot()
 
         Returns:
@@ -83,25 +146,17 @@ class Plotter:
             columns = [columns]
 
         # Determine X axis
-        if x is None:
-            x_data = self.loader.time
-            if x_data is None:
-                x_data = self.loader.data.index
-                xlabel = xlabel or 'Index'
-            else:
-                xlabel = xlabel or 'Time'
-        else:
-            x_data = self.loader[x]
-            xlabel = xlabel or x
+        x_data, x_label = self._x_values(self.loader, x)
+        xlabel = xlabel or x_label
 
         # Create figure
         fig, ax = plt.subplots(figsize=figsize or self.figsize)
 
         # Plot each column
         for col in columns:
-            y_data = self.loader[col]
+            y_data = self.loader[col].to_numpy()
             label = self._simplify_label(col)
-            ax.plot(x_data, y_data, label=label, **kwargs)
+            ax.plot(*_minmax_decimate(x_data, y_data, max_points), label=label, **kwargs)
 
         # Configure plot
         if title:
@@ -128,6 +183,7 @@ class Plotter:
         sharey: bool = False,
         title: str | None = None,
         figsize: tuple | None = None,
+        max_points: int | None = 10_000,
         **kwargs
     ) -> tuple[plt.Figure, np.ndarray]:
         """
@@ -142,6 +198,8 @@ class Plotter:
             sharey: Share Y axis between subplots
             title: Overall figure title
             figsize: Figure size
+            max_points: Longer traces are min/max decimated to about this many
+                        points before drawing; None draws every point
             **kwargs: Additional arguments for plt.plot()
 
         Returns:
@@ -152,13 +210,8 @@ class Plotter:
         if rows is None:
             rows = (n_plots + cols - 1) // cols
 
-        # Determine X axis
-        if x is None:
-            x_data = self.loader.time
-            if x_data is None:
-                x_data = self.loader.data.index
-        else:
-            x_data = self.loader[x]
+        # Determine X axis (resolved once, shared by every subplot)
+        x_data, _ = self._x_values(self.loader, x)
 
         # Calculate figure size
         if figsize is None:
@@ -178,10 +231,10 @@ class Plotter:
                 break
 
             ax = axes[i]
-            y_data = self.loader[col]
+            y_data = self.loader[col].to_numpy()
             label = self._simplify_label(col)
 
-            ax.plot(x_data, y_data, **kwargs)
+            ax.plot(*_minmax_decimate(x_data, y_data, max_points), **kwargs)
             ax.set_ylabel(label)
             ax.grid(True, alpha=0.3)
 
@@ -226,10 +279,16 @@ class Plotter:
 
         fig, ax = plt.subplots(figsize=figsize or self.figsize)
 
-        for loader, label in zip(all_loaders, labels):
-            x_data = loader.time if loader.time is not None else loader.data.index
-            y_data = loader[column]
-            ax.plot(x_data, y_data, label=label, **kwargs)
+        # All traces go through one ax.plot() call: one pass of argument
+        # handling and a single autoscale instead of one per loader
+        traces = []
+        for loader in all_loaders:
+            x_data, _ = self._x_values(loader)
+            traces += [x_data, loader[column].to_numpy()]
+
+        lines = ax.plot(*traces, **kwargs)
+        for line, label in zip(lines, labels):
+            line.set_label(label)
 
         ax.set_title(title or f'Comparison: {column}')
         ax.legend()
@@ -269,7 +328,8 @@ class Plotter:
 
         # Labels
         ax.set_yticks(range(len(columns)))
-        ax.set_yticklabels([self._simplify_label(c) for c in columns])
+        labels = [self._simplify_label(c) for c in columns]
+        ax.set_yticklabels(labels)
         ax.set_xlabel('Sample')
 
         if title:
@@ -291,25 +351,93 @@ class Plotter:
         columns = self.loader.columns[:n_columns]
         return self.subplots(columns, title=f'Quick View: {self.loader.filepath.name}')
 
+    def _x_values(self, loader: DataLoader, x: str | None = None) -> tuple[np.ndarray, str]:
+        """
+        Returns the X axis values as an array, and its default label.
+
+        `x` is a column name; None selects the time axis, or the index if
+        there is none. Called once per plot, so the axis is converted once
+        however many channels share it. A generated time axis is computed
+        from its step without being stored in the loader's data.
+        """
+        if x is None:
+            x_data = loader.time
+            if x_data is None:
+                x_data, label = loader.data.index, 'Index'
+            else:
+                label = 'Time'
+        else:
+            x_data, label = loader[x], x
+
+        return x_data.to_numpy(), label
+
     def _simplify_label(self, column: str) -> str:
-        """Simplifies column name for use as label."""
+        """Simplifies column name for use as label (cached per column)."""
+        label = self._label_cache.get(column)
+        if label is None:
+            label = self._label_cache[column] = self._make_label(str(column))
+        return label
+
+    def _make_label(self, column: str) -> str:
+        """Builds the simplified label of a column name."""
         # Remove common prefixes
-        import re
-        match = re.search(r'_(\d+)', str(column))
+        match = _SUFFIX_NUMBER_RE.search(column)
         if match:
             return f'Ch {match.group(1)}'
 
         # For Keysight, extract channel number
-        match = re.match(r'(\d+)', str(column))
+        match = _LEADING_NUMBER_RE.match(column)
         if match:
             return f'Ch {match.group(1)}'
 
-        return str(column)
+        return column
 
     def show(self):
         """Shows all plots."""
         plt.show()
 
     def save(self, filename: str, dpi: int = 150, **kwargs):
-        """Saves the current figure."""
-        plt.savefig(filename, dpi=dpi, bbox_inches='tight', **kwargs)
+        """
+        Saves the current figure.
+
+        In vector formats, lines longer than 100 000 points are embedded as
+        images at `dpi`, keeping files small and fast to render; axes, text
+        and shorter lines stay vector.
+        """
+        fig = plt.gcf()
+        self._rasterize_long_lines(fig)
+        fig.savefig(filename, dpi=dpi, bbox_inches='tight', **kwargs)
+
+    def save_batch(
+        self,
+        figures: Sequence[plt.Figure],
+        filenames: Sequence[str],
+        dpi: int = 150,
+        close: bool = True,
+        **kwargs
+    ):
+        """
+        Saves several figures, e.g. the results of a loop over files.
+
+        Args:
+            figures: Figures to save
+            filenames: Output file for each figure
+            dpi: Resolution for raster output and rasterized lines
+            close: Close each figure once saved, releasing its memory
+            **kwargs: Additional arguments for savefig()
+        """
+        if len(figures) != len(filenames):
+            raise ValueError("figures and filenames must have the same length")
+
+        for fig, filename in zip(figures, filenames):
+            self._rasterize_long_lines(fig)
+            fig.savefig(filename, dpi=dpi, bbox_inches='tight', **kwargs)
+            if close:
+                plt.close(fig)
+
+    def _rasterize_long_lines(self, fig: plt.Figure):
+        """Marks lines with many points to be drawn as images in vector output."""
+        for ax in fig.axes:
+            for line in ax.get_lines():
+                if len(line.get_xdata(orig=False)) > _RASTERIZE_MIN_POINTS:
+                    line.set_rasterized(True)
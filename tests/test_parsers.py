@@ -0,0 +1,104 @@
+"""
+Regression tests for the file parsers.
+"""
+
+import openpyxl
+import pandas as pd
+from labdataplot import DataLoader
+
+
+def test_generic_csv_hms_time_column(tmp_path):
+    """HH:MM:SS times are parsed as datetimes, whichever CSV engine reads them."""
+    path = tmp_path / 'log.csv'
+    path.write_text('Time,V1,V2\n10:00:00,1.0,2.0\n10:00:01,1.5,2.5\n10:00:02,2.0,3.0\n')
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.time_column == 'Time'
+    assert pd.api.types.is_datetime64_any_dtype(loader.data['Time'])
+    assert loader.data['Time'].dt.second.tolist() == [0, 1, 2]
+
+
+def test_fluke_csv_hms_time_column(tmp_path):
+    """Fluke Hydra exports with HH:MM:SS times load a datetime time column."""
+    path = tmp_path / 'hydra.csv'
+    path.write_text(
+        'Fluke Hydra 2638A\n'
+        'Date: 2024/01/02\n'
+        'Time,CH1 (V),CH2 (degC)\n'
+        '12:00:00,0.0,20\n'
+        '12:00:01,1.5,21\n'
+        '12:00:02,3.0,22\n'
+    )
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.equipment.startswith('Fluke')
+    assert pd.api.types.is_datetime64_any_dtype(loader.data['Time'])
+    assert loader.data['Time'].dt.hour.tolist() == [12, 12, 12]
+
+
+def test_hioki_csv_shift_jis_after_header(tmp_path):
+    """A Shift-JIS byte past the header lines still selects the right encoding."""
+    lines = ['HIOKI LR8400 Memory HiLogger', 'Date,2024/01/02']
+    lines += [f'Info,{i}' for i in range(8)]
+    lines += ['Time,CH1 (V),Note']
+    lines += [f'{i}.0,{i}.5,ok' for i in range(30)]
+    lines += ['30.0,1.0,異常']
+    path = tmp_path / 'lr8400.csv'
+    path.write_bytes(('\n'.join(lines) + '\n').encode('shift-jis'))
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.equipment.startswith('Hioki')
+    assert len(loader.data) == 31
+    assert loader.data['Note'].iloc[-1] == '異常'
+
+
+def test_dewesoft_sample_time_column(tmp_path):
+    """The generated Sample time column is a real column of the data."""
+    wb = openpyxl.Workbook()
+    root = wb.active
+    root.title = '20240102_120000 (root)'
+    root.append(['Name'])
+    root.append(['run1'])
+    data = wb.create_sheet('Data')
+    data.append(['NN_01', 'NN_02'])
+    for i in range(5):
+        data.append([i * 0.1, i * 0.2])
+    path = tmp_path / 'dewesoft.xlsx'
+    wb.save(path)
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.time_column == 'Sample'
+    assert loader.data[loader.info.time_column].tolist() == [0, 1, 2, 3, 4]
+    assert loader.columns == ['NN_01', 'NN_02']
+
+
+def test_keithley_reading_time_column(tmp_path):
+    """Keithley files without a time column get a Reading column."""
+    path = tmp_path / 'dmm.csv'
+    path.write_text(
+        'KEITHLEY INSTRUMENTS DMM6500\n'
+        'Voltage (V),Current (A)\n'
+        '1.0,0.1\n2.0,0.2\n3.0,0.3\n'
+    )
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.time_column == 'Reading'
+    assert loader.data[loader.info.time_column].tolist() == [0, 1, 2]
+    assert loader.columns == ['Voltage (V)', 'Current (A)']
+
+
+def test_generic_csv_index_time_column(tmp_path):
+    """Generic CSV files without a time-like column get an Index column."""
+    path = tmp_path / 'labels.csv'
+    path.write_text('Name,V1\nfoo,1\nbar,2\nbaz,3\n')
+
+    loader = DataLoader(str(path), cache=False)
+
+    assert loader.info.time_column == 'Index'
+    assert loader.data[loader.info.time_column].tolist() == [0, 1, 2]
+    assert loader.columns == ['Name', 'V1']
@@ -0,0 +1,45 @@
+"""
+Regression tests for the Plotter.
+"""
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+from labdataplot import DataLoader, Plotter  # noqa: E402
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'log.csv'
+    rows = '\n'.join(f'{i * 0.1:.1f},{i},{-i}' for i in range(10))
+    path.write_text(f'Time,V1,V2\n{rows}\n')
+    return path
+
+
+def test_plot_follows_in_place_edits(csv_path):
+    """A second plot reflects changes made to loader.data in place."""
+    loader = DataLoader(str(csv_path), cache=False)
+    plotter = Plotter(loader)
+    plotter.plot('V1')
+
+    loader.data['Time'] *= 1000
+    _, ax = plotter.plot('V1')
+    assert ax.lines[0].get_xdata().max() == pytest.approx(900.0)
+
+    loader.data.drop(loader.data.index[:5], inplace=True)
+    _, ax = plotter.plot('V1')
+    assert len(ax.lines[0].get_xdata()) == 5
+    plt.close('all')
+
+
+def test_plot_keeps_generated_time_axis_lazy(csv_path):
+    """Plotting against a time_step axis does not store it in the data."""
+    loader = DataLoader(str(csv_path), cache=False, time_step=0.5)
+    _, ax = Plotter(loader).plot('V1')
+
+    assert ax.lines[0].get_xdata()[-1] == pytest.approx(4.5)
+    assert loader._time_axis is not None
+    plt.close('all')